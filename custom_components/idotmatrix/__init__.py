@@ -13,6 +13,8 @@ from homeassistant.helpers import config_validation as cv
 
 from .const import DOMAIN, CONF_MAC
 from .client.connectionManager import ConnectionManager
+from .client.gifCache import GifCache
+from .client.modules.gif import Gif
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -94,20 +96,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     hass.data.setdefault(DOMAIN, {})
     
-    # Initialize connection manager (singleton currently, might need adaptation per entry if multiple devices supported properly)
-    # For now, we store the address in the manager? Or pass it to entities?
-    # The client library assumes Singleton ConnectionManager. 
-    # We might need to refactor the client library eventually to support multiple instances.
-    # For now, we will assume one device per integration instance or update the singleton.
-    
     hass.data[DOMAIN][entry.entry_id] = entry.data
-    
-    # Initialize the Singleton ConnectionManager with the device address
-    manager = ConnectionManager()
-    manager.set_hass(hass)
-    manager.address = entry.data[CONF_MAC]
 
     from .coordinator import IDotMatrixCoordinator
+    # Transcoded GIFs are shared by all devices
+    GifCache.configure(hass.config.path(".storage", "idotmatrix", "gifs"))
     coordinator = IDotMatrixCoordinator(hass, entry)
     await coordinator.async_load_settings()
     await coordinator.async_config_entry_first_refresh()
@@ -259,6 +252,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         storage.save_design(msg["name"], msg["layers"])
         connection.send_result(msg["id"])
 
+        # Warm the icon store so the design renders without fetching later.
+        # Stored icons are shared, so one device is enough.
+        for coordinator in hass.data[DOMAIN].values():
+            if isinstance(coordinator, IDotMatrixCoordinator):
+                hass.async_create_task(coordinator.async_prefetch_icons(msg["layers"]))
+                break
+
     @websocket_api.websocket_command({
         "type": "idotmatrix/delete_design",
         "name": str,
@@ -332,9 +332,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if coordinator:
         if hasattr(coordinator, "_clear_face_tracking"):
             coordinator._clear_face_tracking()
+        if hasattr(coordinator, "_cancel_frame_tasks"):
+            coordinator._cancel_frame_tasks()
         if hasattr(coordinator, "async_stop_gif_rotation"):
             await coordinator.async_stop_gif_rotation()
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        await ConnectionManager.release(entry.data[CONF_MAC])
+        from .coordinator import IDotMatrixCoordinator
+        if not any(isinstance(c, IDotMatrixCoordinator) for c in hass.data[DOMAIN].values()):
+            # Last device gone, stop the GIF transcoding workers
+            Gif.shutdownPool()
 
     return unload_ok
@@ -37,7 +37,7 @@ class IDotMatrixSyncTime(IDotMatrixEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Handle the button press."""
         now = datetime.datetime.now()
-        await Common().setTime(
+        await Common(self.coordinator.conn).setTime(
             year=now.year,
             month=now.month,
             day=now.day,
@@ -59,4 +59,5 @@ class IDotMatrixClear(IDotMatrixEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Handle the button press."""
         # Set black screen
-        await FullscreenColor().setMode(0, 0, 0)
+        self.coordinator.invalidate_frame_cache()
+        await FullscreenColor(self.coordinator.conn).setMode(0, 0, 0)
@@ -0,0 +1,99 @@
+"""Bounded in-memory caches for rendered assets."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+from typing import Any, Callable, Hashable, Iterator
+
+# Returned by BoundedCache.get when a key is not cached, as None is a valid
+# (negative) cached value
+MISSING = object()
+
+
+class BoundedCache:
+    """LRU cache bounded by entry count and approximate size in bytes.
+
+    None values are negative entries, e.g. icons that failed to load. They
+    expire after negative_ttl seconds so that transient failures are retried.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        sizeof: Callable[[Any], int],
+        negative_ttl: float = 300.0,
+    ) -> None:
+        """Initialize."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self._sizeof = sizeof
+        # key -> (value, size in bytes, expiry of negative entries)
+        self._data: OrderedDict[Hashable, tuple[Any, int, float | None]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value and mark it as recently used."""
+        entry = self._data.get(key)
+        if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+            self.pop(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries if needed."""
+        self.pop(key)
+        if value is None:
+            size = 0
+            expires = time.monotonic() + self.negative_ttl
+        else:
+            size = self._sizeof(value)
+            expires = None
+        self._data[key] = (value, size, expires)
+        self._bytes += size
+        while len(self._data) > self.max_entries or (
+            self._bytes > self.max_bytes and len(self._data) > 1
+        ):
+            _, (_, evicted_size, _) = self._data.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a key if it is cached."""
+        if (entry := self._data.pop(key, None)) is not None:
+            self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+        self._bytes = 0
+
+    def keys(self) -> Iterator[Hashable]:
+        """Return a snapshot of the cached keys."""
+        return iter(list(self._data))
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and (entry[2] is None or entry[2] > time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        """Return usage statistics."""
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
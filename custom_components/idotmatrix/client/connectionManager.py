@@ -1,33 +1,81 @@
 import asyncio
+import contextlib
+import itertools
 from bleak import BleakClient, BleakScanner, AdvertisementData
 from .const import UUID_READ_DATA, UUID_WRITE_DATA, BLUETOOTH_DEVICE_NAME
 import logging
 import time
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+# Send priorities, lowest value is written first. Control commands (screen
+# on/off, brightness) overtake queued bulk image/GIF chunks; payloads with the
+# same priority keep their submission order.
+PRIORITY_CONTROL = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BULK = 2
 
-class SingletonMeta(type):
-    logging = logging.getLogger(__name__)
-    _instances: dict = {}
 
-    def __call__(cls, *args, **kwargs) -> "SingletonMeta":
-        if cls not in cls._instances:
-            try:
-                instance = super().__call__(*args, **kwargs)
-                cls._instances[cls] = instance
-            except:
-                # return None if wrong (or no arguments are given)
-                cls._instances[cls] = None
-        return cls._instances[cls]
+class ConnectionManager:
+    """Manages the BLE connection to a single iDotMatrix device.
 
+    One instance exists per device address. Use ``for_address`` to obtain the
+    shared instance for a given MAC so that every module talking to the same
+    panel goes through the same client.
+    """
 
-class ConnectionManager(metaclass=SingletonMeta):
     logging = logging.getLogger(__name__)
+    _registry: Dict[str, "ConnectionManager"] = {}
 
-    def __init__(self) -> None:
-        self.address: Optional[str] = None
+    def __init__(self, address: Optional[str] = None, hass=None) -> None:
+        self.address: Optional[str] = address
         self.client: Optional[BleakClient] = None
-        self.hass = None
+        self.hass = hass
+        # Incremented on every new connection, lets callers detect reconnects.
+        self.generation = 0
+        # Held by multi-payload uploads so two transfers never interleave,
+        # see transfer()
+        self.transfer_lock = asyncio.Lock()
+        self._transfer_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._sequence = itertools.count()
+        self.stats: Dict[str, Any] = {
+            "queued": 0,
+            "sent": 0,
+            "sent_bytes": 0,
+            "failed": 0,
+            "max_queue_depth": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0,
+        }
+
+    @classmethod
+    def for_address(cls, address: str, hass=None) -> "ConnectionManager":
+        """Return the connection manager registered for the given address.
+
+        Args:
+            address (str): MAC address of the device.
+            hass: Optional Home Assistant instance for proxy support.
+
+        Returns:
+            ConnectionManager: the (possibly newly created) manager for this address.
+        """
+        key = address.upper()
+        manager = cls._registry.get(key)
+        if manager is None:
+            manager = cls(address=address, hass=hass)
+            cls._registry[key] = manager
+        elif hass is not None:
+            manager.set_hass(hass)
+        return manager
+
+    @classmethod
+    async def release(cls, address: str) -> None:
+        """Disconnect and forget the manager registered for the given address."""
+        manager = cls._registry.pop(address.upper(), None)
+        if manager is not None:
+            await manager.disconnect()
 
     def set_hass(self, hass):
         """Set Home Assistant instance for proxy support."""
@@ -64,6 +112,10 @@ class ConnectionManager(metaclass=SingletonMeta):
             self.logging.error("no target devices found.")
 
     async def connect(self) -> None:
+        async with self._connect_lock:
+            await self._connect()
+
+    async def _connect(self) -> None:
         if self.address:
             # Check if client exists and is connected
             if self.client and self.client.is_connected:
@@ -105,6 +157,7 @@ class ConnectionManager(metaclass=SingletonMeta):
                     self.client = None
                     return
                     
+                self.generation += 1
                 self.logging.info(f"connected to {self.address}")
             except Exception as e:
                 self.logging.error(f"Failed to connect to {self.address}: {e}")
@@ -114,6 +167,13 @@ class ConnectionManager(metaclass=SingletonMeta):
             self.logging.error("device address is not set.")
 
     async def disconnect(self) -> None:
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
         if self.client and self.client.is_connected:
             await self.client.disconnect()
             self.logging.info(f"disconnected from {self.address}")
@@ -121,7 +181,107 @@ class ConnectionManager(metaclass=SingletonMeta):
     # Match the Android app's BLE write size (MTU 517 - ATT overhead = 509)
     BLE_WRITE_SIZE = 509
 
-    async def send(self, data, response=False):
+    @contextlib.asynccontextmanager
+    async def transfer(self) -> AsyncIterator[None]:
+        """Reserve the device for a sequence of payloads that belong together.
+
+        While the transfer is active, sends of other tasks wait until it is
+        done, except PRIORITY_CONTROL ones. Re-entering from the task that
+        owns the transfer is a no-op, so e.g. a mode switch and the upload
+        that follows it can share one transfer.
+        """
+        if self._transfer_task is asyncio.current_task():
+            yield
+            return
+        async with self.transfer_lock:
+            self._transfer_task = asyncio.current_task()
+            try:
+                yield
+            finally:
+                self._transfer_task = None
+
+    async def send(self, data, response=False, priority: int = PRIORITY_NORMAL):
+        """Queue a payload for the device and wait until it has been written.
+
+        All writes go through a single writer task per device, so payloads of
+        concurrent callers never interleave on the GATT characteristic. Sends
+        from outside an active transfer wait until it is done, unless they
+        are PRIORITY_CONTROL.
+
+        Args:
+            data: payload to write.
+            response (bool): use write-with-response for every BLE packet.
+            priority (int): one of PRIORITY_CONTROL, PRIORITY_NORMAL or PRIORITY_BULK.
+
+        Returns:
+            True once written, None if the device is not connected.
+        """
+        if not (self.client and self.client.is_connected):
+            return None
+        if (
+            priority != PRIORITY_CONTROL
+            and self.transfer_lock.locked()
+            and self._transfer_task is not asyncio.current_task()
+        ):
+            # Queued right after the lock is released, so no other transfer
+            # can start in between
+            async with self.transfer_lock:
+                pass
+        loop = asyncio.get_running_loop()
+        if self._writer_task is None or self._writer_task.done():
+            self._queue = asyncio.PriorityQueue()
+            self._writer_task = loop.create_task(self._writer())
+        future = loop.create_future()
+        self._queue.put_nowait(
+            (priority, next(self._sequence), time.monotonic(), data, response, future)
+        )
+        self.stats["queued"] += 1
+        depth = self._queue.qsize()
+        if depth > self.stats["max_queue_depth"]:
+            self.stats["max_queue_depth"] = depth
+        return await future
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return send queue metrics for this device."""
+        stats = dict(self.stats)
+        stats["queue_depth"] = self._queue.qsize() if self._queue else 0
+        stats["avg_wait"] = stats["total_wait"] / stats["sent"] if stats["sent"] else 0.0
+        return stats
+
+    async def _writer(self) -> None:
+        """Write queued payloads to the device one at a time."""
+        queue = self._queue
+        try:
+            while True:
+                _, _, queued_at, data, response, future = await queue.get()
+                if future.done():
+                    # The caller gave up while the payload was waiting.
+                    continue
+                wait = time.monotonic() - queued_at
+                self.stats["total_wait"] += wait
+                if wait > self.stats["max_wait"]:
+                    self.stats["max_wait"] = wait
+                try:
+                    result = await self._write(data, response)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as error:
+                    self.stats["failed"] += 1
+                    if not future.done():
+                        future.set_exception(error)
+                else:
+                    self.stats["sent"] += 1
+                    self.stats["sent_bytes"] += len(data)
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            while not queue.empty():
+                future = queue.get_nowait()[-1]
+                if not future.done():
+                    future.cancel()
+
+    async def _write(self, data, response=False):
         if self.client and self.client.is_connected:
             self.logging.debug("sending %d bytes to device", len(data))
             # Cap chunk size to real BLE MTU regardless of proxy-reported size.
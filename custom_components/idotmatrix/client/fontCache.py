@@ -0,0 +1,185 @@
+from collections import OrderedDict
+import functools
+import logging
+import os
+import threading
+import weakref
+from typing import Dict, NamedTuple, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+
+class Glyph(NamedTuple):
+    """A rasterized character of a font."""
+
+    mask: Image.Image  # glyph coverage, mode "L" (antialiased) or "1"
+    bbox: Tuple[int, int, int, int]  # ink box relative to the text origin
+
+    @property
+    def width(self) -> int:
+        """Ink width of the glyph, used as advance by the renderers."""
+        return self.bbox[2] - self.bbox[0]
+
+    @property
+    def height(self) -> int:
+        return self.bbox[3] - self.bbox[1]
+
+
+class FontCache:
+    """Process-wide cache of loaded fonts.
+
+    Shared by the face renderer, the multiline text renderer and the Text
+    module so fonts are parsed from disk once per (path, size) instead of on
+    every render. The least recently used fonts are evicted once MAX_FONTS
+    entries are loaded.
+
+    Each font also carries a glyph cache so laying out and drawing text is a
+    lookup plus a mask blit per character.
+    """
+
+    logging = logging.getLogger(__name__)
+    # using open source font from https://www.fontspace.com/rain-font-f22577
+    DEFAULT_FONT = "Rain-DRM3.otf"
+    FONTS_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fonts"
+    )
+    # Room for the multiline autosize sweep, which tries every size from the
+    # screen size (up to 64) down to 6, plus the fonts of the face layers
+    MAX_FONTS = 96
+
+    _fonts: "OrderedDict[Tuple[str, int], ImageFont.FreeTypeFont]" = OrderedDict()
+    _glyphs: "weakref.WeakKeyDictionary[ImageFont.FreeTypeFont, Dict[Tuple[str, str], Glyph]]" = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def resolvePath(font_name: Optional[str] = None) -> str:
+        """Resolve a font name or path to an existing font file.
+
+        Absolute paths are used as they are, other names are looked up in the
+        bundled fonts directory first. Unknown fonts fall back to the default
+        font. Results are memoized.
+
+        Args:
+            font_name (str, optional): file name in the fonts directory or a path.
+
+        Returns:
+            str: path of the font file to load.
+        """
+        default_path = os.path.join(FontCache.FONTS_DIR, FontCache.DEFAULT_FONT)
+        if not font_name:
+            return default_path
+        if os.path.isabs(font_name):
+            if os.path.exists(font_name):
+                return font_name
+        else:
+            potential_path = os.path.join(FontCache.FONTS_DIR, font_name)
+            if os.path.exists(potential_path):
+                return potential_path
+            if os.path.exists(font_name):
+                return font_name
+        FontCache.logging.warning(
+            "Font path %s not found, falling back to %s",
+            font_name,
+            FontCache.DEFAULT_FONT,
+        )
+        return default_path
+
+    @classmethod
+    def getFont(cls, font_name: Optional[str], size: int) -> ImageFont.FreeTypeFont:
+        """Return the loaded font for the given name or path and size.
+
+        Args:
+            font_name (str, optional): file name in the fonts directory or a path.
+            size (int): font size in pixels.
+
+        Returns:
+            ImageFont.FreeTypeFont: the cached font, the default font if the
+            requested one cannot be loaded, or Pillow's built-in font as a last resort.
+        """
+        key = (cls.resolvePath(font_name), int(size))
+        with cls._lock:
+            font = cls._fonts.get(key)
+            if font is not None:
+                cls._fonts.move_to_end(key)
+                return font
+
+        font = cls._load(*key)
+        with cls._lock:
+            cls._fonts[key] = font
+            cls._fonts.move_to_end(key)
+            while len(cls._fonts) > cls.MAX_FONTS:
+                cls._fonts.popitem(last=False)
+        return font
+
+    @classmethod
+    def _load(cls, font_path: str, size: int) -> ImageFont.FreeTypeFont:
+        """Load a font from disk, falling back to the default font."""
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception as exc:
+            cls.logging.warning(
+                "Failed to load font %s, falling back to default: %s",
+                font_path,
+                exc,
+            )
+        try:
+            return ImageFont.truetype(
+                os.path.join(cls.FONTS_DIR, cls.DEFAULT_FONT), size
+            )
+        except Exception:
+            return ImageFont.load_default()
+
+    @classmethod
+    def getGlyph(cls, font: ImageFont.FreeTypeFont, char: str, mode: str = "L") -> Glyph:
+        """Return the rasterized glyph of a character.
+
+        Args:
+            font (ImageFont.FreeTypeFont): font to render with.
+            char (str): single character.
+            mode (str): "L" for antialiased masks, "1" for monochrome ones.
+
+        Returns:
+            Glyph: cached mask and ink box of the character.
+        """
+        with cls._lock:
+            glyphs = cls._glyphs.get(font)
+            if glyphs is None:
+                glyphs = cls._glyphs[font] = {}
+            glyph = glyphs.get((char, mode))
+        if glyph is not None:
+            return glyph
+
+        left, top, right, bottom = font.getbbox(char, mode=mode)
+        mask = Image.new(mode, (max(right - left, 0), max(bottom - top, 0)), 0)
+        if mask.width and mask.height:
+            ImageDraw.Draw(mask).text(
+                (-left, -top), char, font=font, fill=255 if mode == "L" else 1
+            )
+        glyph = Glyph(mask, (left, top, right, bottom))
+        with cls._lock:
+            glyphs[(char, mode)] = glyph
+        return glyph
+
+    @staticmethod
+    def drawGlyph(image: Image.Image, xy: Tuple[int, int], glyph: Glyph, fill=255) -> None:
+        """Blit a glyph onto an image as if the character was drawn at xy.
+
+        Args:
+            image (Image.Image): target image.
+            xy (Tuple[int, int]): text origin, as passed to ImageDraw.text.
+            glyph (Glyph): glyph from getGlyph.
+            fill: ink for the covered pixels, in the target image's mode.
+        """
+        if not (glyph.mask.width and glyph.mask.height):
+            return
+        x = int(xy[0]) + glyph.bbox[0]
+        y = int(xy[1]) + glyph.bbox[1]
+        image.paste(fill, (x, y, x + glyph.mask.width, y + glyph.mask.height), glyph.mask)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached fonts, glyphs and resolved paths."""
+        with cls._lock:
+            cls._fonts.clear()
+            cls._glyphs.clear()
+        cls.resolvePath.cache_clear()
@@ -0,0 +1,120 @@
+import hashlib
+import logging
+import os
+import threading
+from typing import Optional
+
+
+class GifCache:
+    """Process-wide on-disk cache of transcoded, device-ready GIFs.
+
+    Entries are keyed by a hash of the source file and every setting that
+    affects the output, so the same animation is only transcoded once per
+    pixel size and encoder settings. The least recently used entries are
+    removed once the cache grows beyond MAX_BYTES.
+
+    The cache is disabled until a directory is configured.
+    """
+
+    logging = logging.getLogger(__name__)
+    MAX_BYTES = 64 * 1024 * 1024
+
+    directory: Optional[str] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, directory: Optional[str], max_bytes: Optional[int] = None) -> None:
+        """Set the cache directory and optionally its size limit.
+
+        Args:
+            directory (str, optional): where to store the GIFs, None disables the cache.
+            max_bytes (int, optional): total size the cache is trimmed to.
+        """
+        cls.directory = directory
+        if max_bytes is not None:
+            cls.MAX_BYTES = max_bytes
+
+    @staticmethod
+    def makeKey(source: bytes, *settings) -> str:
+        """Build the cache key of a source file and its transcoding settings.
+
+        Args:
+            source (bytes): contents of the source GIF.
+            *settings: values the output depends on, e.g. pixel size.
+
+        Returns:
+            str: hex digest usable as file name.
+        """
+        digest = hashlib.sha1(source)
+        digest.update(repr(settings).encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def _path(cls, key: str) -> str:
+        return os.path.join(cls.directory, f"{key}.gif")
+
+    @classmethod
+    def get(cls, key: str) -> Optional[bytes]:
+        """Return the cached GIF for a key, or None.
+
+        Args:
+            key (str): key from makeKey.
+
+        Returns:
+            Optional[bytes]: the cached GIF data.
+        """
+        if not cls.directory:
+            return None
+        path = cls._path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            # mtime doubles as last access time for the eviction
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    @classmethod
+    def put(cls, key: str, data: bytes) -> None:
+        """Store a GIF and trim the cache to its size limit.
+
+        Args:
+            key (str): key from makeKey.
+            data (bytes): the transcoded GIF.
+        """
+        if not cls.directory:
+            return
+        try:
+            os.makedirs(cls.directory, exist_ok=True)
+            path = cls._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+            cls._evict()
+        except OSError as error:
+            cls.logging.warning(f"could not cache transcoded gif: {error}")
+
+    @classmethod
+    def _evict(cls) -> None:
+        """Remove the least recently used GIFs beyond MAX_BYTES."""
+        with cls._lock:
+            entries = []
+            total = 0
+            with os.scandir(cls.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(".gif"):
+                        continue
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+            entries.sort()
+            for _, size, path in entries:
+                if total <= cls.MAX_BYTES:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
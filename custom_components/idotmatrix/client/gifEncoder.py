@@ -0,0 +1,198 @@
+import struct
+from typing import BinaryIO, Optional, Tuple
+from PIL import Image, ImageChops
+
+
+class GifEncoder:
+    """Streaming GIF89a writer for the device's GIF parser.
+
+    All frames share one global color table, the device does not support
+    local color tables. In delta mode, after the first frame only the
+    rectangle that changed is written, with unchanged pixels inside it set to
+    a transparent color index if that encodes smaller, and frames are never
+    disposed so they build on each other. Identical consecutive frames are
+    merged into one by extending its duration. Otherwise every frame is
+    written in full and disposed to the background (disposal 2), the layout
+    the device is known to accept.
+
+    Frames are written as they come in, only the previous frame is kept.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        size: Tuple[int, int],
+        palette: bytes,
+        loop: int = 0,
+        transparency: bool = True,
+        delta: bool = True,
+    ) -> None:
+        """Write the GIF header.
+
+        Args:
+            stream (BinaryIO): where to write the GIF.
+            size (Tuple[int, int]): width and height of all frames.
+            palette (bytes): flat RGB palette, at most 256 colors, or 255 if
+                transparency is used.
+            loop (int): number of loops, 0 loops forever.
+            transparency (bool): reserve a palette slot for unchanged pixels.
+            delta (bool): write changed rectangles instead of full frames.
+        """
+        self.stream = stream
+        self.size = size
+        self.delta = delta
+        colors = len(palette) // 3
+        self.transparent_index: Optional[int] = None
+        if delta and transparency and colors < 256:
+            self.transparent_index = colors
+            colors += 1
+        # Color table size is a power of two, at least 2 entries
+        bits = max(1, (max(colors, 2) - 1).bit_length())
+        self.min_code_size = max(2, bits)
+        self._canvas: Optional[Image.Image] = None
+        self._pending: Optional[list] = None
+
+        table = palette + bytes(3 * ((1 << bits) - len(palette) // 3))
+        stream.write(b"GIF89a")
+        stream.write(struct.pack("<HHBBB", size[0], size[1], 0xF0 | (bits - 1), 0, 0))
+        stream.write(table)
+        # NETSCAPE2.0 application extension for looping
+        stream.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+
+    def addFrame(self, frame: Image.Image, duration: int) -> None:
+        """Add a frame of palette indices.
+
+        Args:
+            frame (Image.Image): frame in mode "P" or "L", pixel values are
+                indices into the palette.
+            duration (int): display time in milliseconds.
+        """
+        if frame.mode != "L":
+            # Compare palette indices, not colors
+            frame = Image.frombytes("L", frame.size, frame.tobytes())
+        if self._canvas is None or not self.delta:
+            self._flush()
+            self._canvas = frame
+            self._pending = [frame, (0, 0), None, duration]
+            return
+
+        diff = ImageChops.difference(frame, self._canvas)
+        box = diff.getbbox()
+        if box is None:
+            # Same image, show the pending frame longer
+            self._pending[3] += duration
+            return
+
+        self._flush()
+        region = frame.crop(box)
+        transparent = None
+        if self.transparent_index is not None:
+            # Unchanged pixels inside the rectangle become transparent
+            changed = diff.crop(box).point(lambda v: 255 if v else 0)
+            transparent = Image.new("L", region.size, self.transparent_index)
+            transparent.paste(region, mask=changed)
+        self._canvas = frame
+        self._pending = [region, box[:2], transparent, duration]
+
+    def close(self) -> None:
+        """Write the last frame and the trailer."""
+        self._flush()
+        self.stream.write(b"\x3b")
+
+    def _flush(self) -> None:
+        """Write the pending frame."""
+        if self._pending is None:
+            return
+        region, (left, top), transparent, duration = self._pending
+        self._pending = None
+
+        data = self._lzwEncode(region.tobytes(), self.min_code_size)
+        use_transparency = False
+        if transparent is not None:
+            transparent_data = self._lzwEncode(transparent.tobytes(), self.min_code_size)
+            if len(transparent_data) < len(data):
+                data = transparent_data
+                use_transparency = True
+
+        # Graphic control extension: disposal 1 (do not dispose) for deltas,
+        # 2 (restore to background) for full frames
+        disposal = 1 if self.delta else 2
+        self.stream.write(
+            struct.pack(
+                "<BBBBHBB",
+                0x21,
+                0xF9,
+                4,
+                (disposal << 2) | (1 if use_transparency else 0),
+                round(duration / 10),
+                self.transparent_index if use_transparency else 0,
+                0,
+            )
+        )
+        # Image descriptor without local color table
+        self.stream.write(
+            struct.pack("<BHHHHB", 0x2C, left, top, region.width, region.height, 0)
+        )
+        self.stream.write(bytes([self.min_code_size]))
+        for i in range(0, len(data), 255):
+            block = data[i : i + 255]
+            self.stream.write(bytes([len(block)]))
+            self.stream.write(block)
+        self.stream.write(b"\x00")
+
+    @staticmethod
+    def _lzwEncode(indices: bytes, min_code_size: int) -> bytes:
+        """Compress palette indices with GIF's variable code length LZW.
+
+        Args:
+            indices (bytes): one palette index per pixel.
+            min_code_size (int): LZW minimum code size of the image.
+
+        Returns:
+            bytes: the compressed data, not yet split into sub-blocks.
+        """
+        clear_code = 1 << min_code_size
+        eoi_code = clear_code + 1
+        code_size = min_code_size + 1
+        next_code = eoi_code + 1
+        table = {}
+        out = bytearray()
+        bits = clear_code
+        bit_count = code_size
+
+        prefix = indices[0]
+        for index in indices[1:]:
+            key = (prefix << 8) | index
+            code = table.get(key)
+            if code is not None:
+                prefix = code
+                continue
+            bits |= prefix << bit_count
+            bit_count += code_size
+            while bit_count >= 8:
+                out.append(bits & 0xFF)
+                bits >>= 8
+                bit_count -= 8
+            if next_code == 4096:
+                # Table full, start over
+                bits |= clear_code << bit_count
+                bit_count += code_size
+                table = {}
+                code_size = min_code_size + 1
+                next_code = eoi_code + 1
+            else:
+                if next_code >= (1 << code_size):
+                    code_size += 1
+                table[key] = next_code
+                next_code += 1
+            prefix = index
+
+        bits |= prefix << bit_count
+        bit_count += code_size
+        bits |= eoi_code << bit_count
+        bit_count += code_size
+        while bit_count > 0:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            bit_count -= 8
+        return bytes(out)
@@ -0,0 +1,258 @@
+import io
+from typing import Iterator, List, Optional, Tuple
+from PIL import Image as PilImage, ImageChops, ImageStat
+from .gifEncoder import GifEncoder
+
+
+class GifTranscoder:
+    """Re-encodes GIFs into the form the device expects.
+
+    Only depends on Pillow and the GIF encoder, so the transcoding worker
+    processes can load it without the rest of the library, see
+    Gif._getPool.
+    """
+
+    # Largest palette of transcoded GIFs, smaller ones are used when they are
+    # close enough: at most PALETTE_MAX_ERROR RMS error per color channel
+    QUANTIZE_COLORS = 256
+    PALETTE_MAX_ERROR = 6.0
+    # Pixels of the frames sampled to build the palette
+    PALETTE_SAMPLE_PIXELS = 128 * 1024
+    # Bump whenever the transcoder output changes, to invalidate cached GIFs
+    TRANSCODE_VERSION = 4
+    # What the size optimizer tries, in order, to fit a GIF into a buffer
+    OPTIMIZE_COLORS = (256, 128, 64, 32, 16, 8, 4)
+    OPTIMIZE_FRAME_STEPS = (1, 2, 3, 4)
+
+    @staticmethod
+    def _iterFrames(
+        gif_data: bytes, pixel_size: int = 32
+    ) -> Iterator[Tuple[PilImage.Image, int]]:
+        """Decode a GIF one frame at a time, scaled to the display size.
+
+        Args:
+            gif_data (bytes): source GIF file contents
+            pixel_size (int, optional): amount of pixels. Defaults to 32.
+
+        Yields:
+            Tuple[PilImage.Image, int]: RGB frame and its duration in ms
+        """
+        with PilImage.open(io.BytesIO(gif_data)) as img:
+            try:
+                while True:
+                    frame = img.convert("RGB")
+                    if frame.size != (pixel_size, pixel_size):
+                        frame = frame.resize(
+                            (pixel_size, pixel_size), PilImage.NEAREST
+                        )
+                    yield frame, img.info.get("duration", 100)
+                    img.seek(img.tell() + 1)
+            except EOFError:
+                pass
+
+    @classmethod
+    def _sampleFrames(
+        cls, gif_data: bytes, pixel_size: int = 32
+    ) -> Tuple[PilImage.Image, List[int]]:
+        """First pass: collect frame durations and palette samples.
+
+        Evenly spaced frames, at most PALETTE_SAMPLE_PIXELS in total, are
+        stacked into one image. Nothing else is kept, so memory does not
+        grow with the number of frames.
+
+        Args:
+            gif_data (bytes): source GIF file contents
+            pixel_size (int, optional): amount of pixels. Defaults to 32.
+
+        Returns:
+            Tuple[PilImage.Image, List[int]]: stacked sample frames and the
+            durations of all frames in ms
+        """
+        with PilImage.open(io.BytesIO(gif_data)) as img:
+            frame_count = getattr(img, "n_frames", 1)
+        count = max(1, min(frame_count, cls.PALETTE_SAMPLE_PIXELS // pixel_size**2))
+        sampled = {i * frame_count // count: i for i in range(count)}
+
+        samples = PilImage.new("RGB", (pixel_size, pixel_size * count))
+        durations = []
+        for index, (frame, duration) in enumerate(cls._iterFrames(gif_data, pixel_size)):
+            if index in sampled:
+                samples.paste(frame, (0, sampled[index] * pixel_size))
+            durations.append(duration)
+        return samples, durations
+
+    @classmethod
+    def _buildPalette(cls, samples: PilImage.Image, colors: int = 256) -> PilImage.Image:
+        """Build a palette shared by all frames.
+
+        Median cut over frames sampled across the whole animation, so colors
+        that only appear in later frames get their own entries. Uses the
+        smallest power-of-two color table within PALETTE_MAX_ERROR.
+
+        Args:
+            samples (PilImage.Image): stacked frames from _sampleFrames
+            colors (int): largest color table, including the transparent index
+
+        Returns:
+            PilImage.Image: 1x1 image carrying the palette, for Image.quantize
+        """
+        table = 4
+        while True:
+            # One entry of the table stays free for transparency
+            quantized = samples.quantize(
+                colors=table - 1, method=PilImage.Quantize.MEDIANCUT
+            )
+            if table >= colors:
+                break
+            error = ImageStat.Stat(
+                ImageChops.difference(samples, quantized.convert("RGB"))
+            ).rms
+            if max(error) <= cls.PALETTE_MAX_ERROR:
+                break
+            table *= 2
+
+        palette_img = PilImage.new("P", (1, 1))
+        palette_img.putpalette(quantized.getpalette())
+        return palette_img
+
+    @classmethod
+    def _encodeFrames(
+        cls,
+        gif_data: bytes,
+        pixel_size: int,
+        samples: PilImage.Image,
+        durations: List[int],
+        colors: int = 256,
+        step: int = 1,
+        count: Optional[int] = None,
+        delta: bool = True,
+    ) -> bytes:
+        """Second pass: decode, quantize and encode the frames one by one.
+
+        Frames after the first are written as the changed rectangle with
+        transparency, see GifEncoder.
+
+        Args:
+            gif_data (bytes): source GIF file contents
+            pixel_size (int): amount of pixels
+            samples (PilImage.Image): stacked frames from _sampleFrames
+            durations (List[int]): frame durations in ms from _sampleFrames
+            colors (int): largest palette size, including the transparent index
+            step (int): keep one frame out of step, extending it over the
+                dropped ones
+            count (int, optional): stop after this many frames
+            delta (bool): write changed rectangles instead of full frames
+
+        Returns:
+            bytes: the encoded GIF
+        """
+        # Quantize all frames to a single shared palette (no LCTs).
+        # The device parser only supports a Global Color Table.
+        palette_img = cls._buildPalette(samples, colors)
+        palette = bytes(palette_img.getpalette())
+
+        gif_buffer = io.BytesIO()
+        encoder = GifEncoder(gif_buffer, (pixel_size, pixel_size), palette, delta=delta)
+        written = 0
+        for index, (rgb_frame, _) in enumerate(cls._iterFrames(gif_data, pixel_size)):
+            if index % step:
+                continue
+            if count is not None and written >= count:
+                break
+            # No dithering, its noise differs between frames and defeats the deltas
+            encoder.addFrame(
+                rgb_frame.quantize(palette=palette_img, dither=PilImage.Dither.NONE),
+                sum(durations[index : index + step]),
+            )
+            written += 1
+        encoder.close()
+        return gif_buffer.getvalue()
+
+    @classmethod
+    def _fitBudget(
+        cls,
+        gif_data: bytes,
+        pixel_size: int,
+        samples: PilImage.Image,
+        durations: List[int],
+        budget: int,
+        delta: bool = True,
+    ) -> bytes:
+        """Encode frames as close to the full quality as fits into budget bytes.
+
+        Reduces the palette first, then merges frames, and as a last resort
+        crops the animation to the frames that fit.
+
+        Args:
+            gif_data (bytes): source GIF file contents
+            pixel_size (int): amount of pixels
+            samples (PilImage.Image): stacked frames from _sampleFrames
+            durations (List[int]): frame durations in ms from _sampleFrames
+            budget (int): maximum size of the GIF in bytes
+            delta (bool): write changed rectangles instead of full frames
+
+        Returns:
+            bytes: the smallest GIF tried if nothing fits
+        """
+        smallest = None
+        for step in cls.OPTIMIZE_FRAME_STEPS:
+            table = None
+            for colors in cls.OPTIMIZE_COLORS:
+                if table is not None and colors >= table:
+                    # The palette builder already settled on a smaller table
+                    continue
+                data = cls._encodeFrames(
+                    gif_data, pixel_size, samples, durations, colors, step, delta=delta
+                )
+                # Color table size from the logical screen descriptor
+                table = 2 << (data[10] & 0x07)
+                if len(data) <= budget:
+                    return data
+                if smallest is None or len(data) < len(smallest):
+                    smallest = data
+
+        # Crop the most reduced animation: binary search for the most frames
+        # that fit
+        low, high = 1, (len(durations) + step - 1) // step - 1
+        while low <= high:
+            count = (low + high) // 2
+            data = cls._encodeFrames(
+                gif_data, pixel_size, samples, durations, colors, step, count, delta
+            )
+            if len(data) <= budget:
+                smallest = data
+                low = count + 1
+            else:
+                high = count - 1
+        return smallest
+
+    @classmethod
+    def transcode(
+        cls, gif_data: bytes, pixel_size: int = 32, budget: Optional[int] = None,
+        delta: bool = True
+    ) -> bytes:
+        """Re-encode a GIF into the form the device expects.
+
+        Streams the source in two passes, so memory use does not depend on
+        the number of frames. Pure function of its arguments so it can run
+        in a worker process.
+
+        Args:
+            gif_data (bytes): source GIF file contents
+            pixel_size (int, optional): amount of pixels. Defaults to 32.
+            budget (int, optional): maximum size of the result in bytes.
+            delta (bool): write changed rectangles instead of full frames,
+                see GifEncoder.
+
+        Returns:
+            bytes: the transcoded GIF
+        """
+        samples, durations = cls._sampleFrames(gif_data, pixel_size)
+        data = cls._encodeFrames(
+            gif_data, pixel_size, samples, durations, cls.QUANTIZE_COLORS, delta=delta
+        )
+        if budget is not None and len(data) > budget:
+            data = cls._fitBudget(
+                gif_data, pixel_size, samples, durations, budget, delta
+            )
+        return data
@@ -6,8 +6,8 @@ from typing import Union
 class Chronograph:
     logging = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def setMode(self, mode: int) -> Union[bool, bytearray]:
         """Starts/Stops the Chronograph.
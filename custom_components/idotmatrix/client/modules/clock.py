@@ -10,8 +10,8 @@ class Clock:
 
     logging = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def setTimeIndicator(self, enabled: bool = True) -> Union[bool, bytearray]:
         """Sets the time indicator of the clock. Does not seem to work currently (maybe in a future update?).
@@ -1,4 +1,4 @@
-from ..connectionManager import ConnectionManager
+from ..connectionManager import ConnectionManager, PRIORITY_CONTROL
 from datetime import datetime
 import logging
 from typing import Optional, Union, List
@@ -11,8 +11,8 @@ class Common:
 
     logging = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def freezeScreen(self) -> bytearray:
         """Freezes or unfreezes the screen.
@@ -30,7 +30,7 @@ class Common:
         )
         if self.conn:
             await self.conn.connect()
-            await self.conn.send(data=data)
+            await self.conn.send(data=data, priority=PRIORITY_CONTROL)
         return data
 
     async def screenOff(self) -> bytearray:
@@ -50,7 +50,7 @@ class Common:
         )
         if self.conn:
             await self.conn.connect()
-            await self.conn.send(data=data)
+            await self.conn.send(data=data, priority=PRIORITY_CONTROL)
         return data
 
     async def screenOn(self) -> bytearray:
@@ -70,7 +70,7 @@ class Common:
         )
         if self.conn:
             await self.conn.connect()
-            await self.conn.send(data=data)
+            await self.conn.send(data=data, priority=PRIORITY_CONTROL)
         return data
 
     async def flipScreen(self, flip: bool = True) -> Union[bool, bytearray]:
@@ -126,7 +126,7 @@ class Common:
             )
             if self.conn:
                 await self.conn.connect()
-                await self.conn.send(data=data)
+                await self.conn.send(data=data, priority=PRIORITY_CONTROL)
             return data
         except Exception as error:
             self.logging.error(f"Could not set the brightness of the screen: {error}")
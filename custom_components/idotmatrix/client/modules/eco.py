@@ -11,8 +11,8 @@ class Eco:
 
     logging = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def setMode(
         self,
@@ -10,8 +10,8 @@ class FullscreenColor:
 
     logging = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def setMode(
         self, r: int = 0, g: int = 0, b: int = 0
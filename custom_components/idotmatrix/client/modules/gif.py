@@ -1,18 +1,60 @@
-from typing import Union, List
-from ..connectionManager import ConnectionManager
-import io
+import asyncio
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import importlib
+import multiprocessing
+import os
+import pickle
+from typing import Union, List, Optional, Tuple
+from ..connectionManager import ConnectionManager, PRIORITY_BULK
+from ..gifCache import GifCache
+from ..gifTranscoder import GifTranscoder
 import logging
-from PIL import Image as PilImage
 import zlib
 
+# Worker processes import the transcoder through this stand-in for the client
+# package. Its __init__ is never run, so a worker loads Pillow and the GIF
+# modules only, not bleak or the Home Assistant integration.
+WORKER_PACKAGE = "idotmatrix_gif_worker"
+_WORKER_BOOTSTRAP = f"""
+import sys, types
+if {WORKER_PACKAGE!r} not in sys.modules:
+    package = types.ModuleType({WORKER_PACKAGE!r})
+    package.__path__ = [{os.path.dirname(os.path.dirname(os.path.abspath(__file__)))!r}]
+    sys.modules[{WORKER_PACKAGE!r}] = package
+"""
+
 
 class Gif:
     logging = logging.getLogger(__name__)
+    # Worker processes transcoding batch uploads, shared by all devices
+    TRANSCODE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+    _pool: Optional[Executor] = None
+    # GifTranscoder.transcode as the worker processes import it
+    _poolTranscode = None
+    # Device GIF buffer for single uploads, and per slot in batch uploads
+    SINGLE_UPLOAD_BUDGET = 128 * 1024
+    BATCH_SLOT_BUDGET = 7 * 1024
+
+    def __init__(self, conn: ConnectionManager, delta: bool = True) -> None:
+        """Initialize.
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+        Args:
+            conn (ConnectionManager): connection to the device, see
+                ConnectionManager.for_address.
+            delta (bool): transcode into frames that only carry the changed
+                rectangle. False writes full frames, for firmwares that do not
+                render delta frames correctly.
+        """
+        self.conn: ConnectionManager = conn
+        self.delta = delta
 
-    def _load(self, file_path: str) -> bytes:
+    @staticmethod
+    def _load(file_path: str) -> bytes:
         """Load a gif file into a byte buffer.
 
         Args:
@@ -107,13 +149,145 @@ class Gif:
             data = self._createPayloads(gif_data)
             if self.conn:
                 await self.conn.connect()
-                for chunk in data:
-                    await self.conn.send(data=chunk)
+                async with self.conn.transfer():
+                    for chunk in data:
+                        await self.conn.send(data=chunk, priority=PRIORITY_BULK)
             return data
         except BaseException as error:
             self.logging.error(f"could not upload gif unprocessed: {error}")
             return False
 
+    def _loadCached(
+        self, file_path: str, pixel_size: int = 32, budget: Optional[int] = None
+    ) -> Tuple[str, bytes, Optional[bytes]]:
+        """Load a GIF file and look up its transcoded version in the cache.
+
+        Args:
+            file_path (str): path to the image file
+            pixel_size (int, optional): amount of pixels. Defaults to 32.
+            budget (int, optional): maximum size of the transcoded GIF in bytes.
+
+        Returns:
+            Tuple[str, bytes, Optional[bytes]]: cache key, source data and
+            the cached transcoded GIF if there is one
+        """
+        gif_data = self._load(file_path)
+        key = GifCache.makeKey(
+            gif_data, pixel_size, budget, GifTranscoder.QUANTIZE_COLORS,
+            GifTranscoder.PALETTE_MAX_ERROR, self.delta, GifTranscoder.TRANSCODE_VERSION
+        )
+        return key, gif_data, GifCache.get(key)
+
+    def _reportSize(
+        self, file_path: str, source_size: int, data: bytes, budget: Optional[int]
+    ) -> None:
+        """Log the size a GIF ends up with, and warn if it exceeds the device buffer."""
+        if budget is not None and len(data) > budget:
+            self.logging.warning(
+                f"{file_path}: {len(data)} bytes after optimizing, "
+                f"still over the {budget} bytes device buffer"
+            )
+        else:
+            self.logging.debug(f"{file_path}: {source_size} -> {len(data)} bytes")
+
+    def _transcodeFile(
+        self, file_path: str, pixel_size: int = 32, budget: Optional[int] = None,
+        raw: bool = False
+    ) -> bytes:
+        """Transcode a GIF file, reusing the cached result if there is one.
+
+        Args:
+            file_path (str): path to the image file
+            pixel_size (int, optional): amount of pixels. Defaults to 32.
+            budget (int, optional): maximum size of the result in bytes.
+            raw (bool): keep the file as it is if it fits into budget.
+
+        Returns:
+            bytes: the transcoded GIF
+        """
+        key, gif_data, data = self._loadCached(file_path, pixel_size, budget)
+        if raw and (budget is None or len(gif_data) <= budget):
+            return gif_data
+        if data is None:
+            data = GifTranscoder.transcode(gif_data, pixel_size, budget, self.delta)
+            GifCache.put(key, data)
+            self._reportSize(file_path, len(gif_data), data, budget)
+        return data
+
+    @classmethod
+    def _getPool(cls) -> Executor:
+        """Return the process pool used for transcoding, creating it on first use."""
+        if cls._pool is None:
+            try:
+                exec(_WORKER_BOOTSTRAP)
+                cls._poolTranscode = importlib.import_module(
+                    f"{WORKER_PACKAGE}.gifTranscoder"
+                ).GifTranscoder.transcode
+                # spawn: forking a process with running threads is unsafe.
+                # The initializer is a builtin, so unpickling it does not
+                # import this package in the worker.
+                cls._pool = ProcessPoolExecutor(
+                    max_workers=cls.TRANSCODE_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=exec,
+                    initargs=(_WORKER_BOOTSTRAP,),
+                )
+            except BaseException as error:
+                cls.logging.warning(f"no process pool for gif transcoding, using threads: {error}")
+                cls._poolTranscode = GifTranscoder.transcode
+                cls._pool = ThreadPoolExecutor(max_workers=cls.TRANSCODE_WORKERS)
+        return cls._pool
+
+    @classmethod
+    def shutdownPool(cls) -> None:
+        """Stop the transcoding worker processes."""
+        if cls._pool is not None:
+            cls._pool.shutdown(wait=False, cancel_futures=True)
+            cls._pool = None
+
+    async def _transcodeAsync(
+        self, file_path: str, pixel_size: int = 32, budget: Optional[int] = None,
+        raw: bool = False
+    ) -> bytes:
+        """Transcode a GIF file in the worker pool, reusing the cached result if there is one.
+
+        Args:
+            file_path (str): path to the image file
+            pixel_size (int, optional): amount of pixels. Defaults to 32.
+            budget (int, optional): maximum size of the result in bytes.
+            raw (bool): keep the file as it is if it fits into budget.
+
+        Returns:
+            bytes: the transcoded GIF
+        """
+        loop = asyncio.get_running_loop()
+        key, gif_data, data = await loop.run_in_executor(
+            None, self._loadCached, file_path, pixel_size, budget
+        )
+        if raw and (budget is None or len(gif_data) <= budget):
+            return gif_data
+        if data is None:
+            pool = self._getPool()
+            try:
+                data = await loop.run_in_executor(
+                    pool, Gif._poolTranscode, gif_data, pixel_size, budget, self.delta
+                )
+            except (BrokenExecutor, pickle.PicklingError, OSError) as error:
+                # The job could not be sent, or the workers died or could not
+                # be started: transcode in a thread instead. A broken pool is
+                # replaced on the next call.
+                self.logging.warning(f"gif transcoding worker failed, using a thread: {error}")
+                if not isinstance(error, pickle.PicklingError) and Gif._pool is pool:
+                    Gif._pool = None
+                    pool.shutdown(wait=False, cancel_futures=True)
+                data = await loop.run_in_executor(
+                    None, GifTranscoder.transcode, gif_data, pixel_size, budget,
+                    self.delta
+                )
+            await loop.run_in_executor(None, GifCache.put, key, data)
+            self._reportSize(file_path, len(gif_data), data, budget)
+        return data
+
     def _processGif(self, file_path: str, pixel_size: int = 32, index: int = 0x0d,
                     interval: int = 5) -> Union[bool, List[bytearray]]:
         """Process a GIF file and create payloads (sync, for use in executor).
@@ -128,40 +302,9 @@ class Gif:
             Union[bool, List[bytearray]]: False if error, otherwise list of payload chunks
         """
         try:
-            with PilImage.open(file_path) as img:
-                frames_rgb = []
-                duration = img.info.get("duration", 100)
-                try:
-                    while True:
-                        frame = img.copy().convert("RGB")
-                        if frame.size != (pixel_size, pixel_size):
-                            frame = frame.resize(
-                                (pixel_size, pixel_size), PilImage.NEAREST
-                            )
-                        frames_rgb.append(frame)
-                        img.seek(img.tell() + 1)
-                except EOFError:
-                    pass
-
-                # Quantize all frames to a single shared palette (no LCTs).
-                # The device parser only supports a Global Color Table.
-                palette_img = frames_rgb[0].quantize(colors=256)
-                frames_p = []
-                for rgb_frame in frames_rgb:
-                    frames_p.append(rgb_frame.quantize(palette=palette_img))
-
-                gif_buffer = io.BytesIO()
-                frames_p[0].save(
-                    gif_buffer,
-                    format="GIF",
-                    save_all=True,
-                    append_images=frames_p[1:],
-                    loop=0,
-                    duration=duration,
-                    disposal=2,
-                )
-                gif_buffer.seek(0)
-                return self._createPayloads(gif_buffer.getvalue(), index=index, interval=interval)
+            budget = self.SINGLE_UPLOAD_BUDGET if index == 0x0d else self.BATCH_SLOT_BUDGET
+            gif_data = self._transcodeFile(file_path, pixel_size, budget)
+            return self._createPayloads(gif_data, index=index, interval=interval)
         except BaseException as error:
             self.logging.error(f"could not process gif: {error}")
             return False
@@ -182,7 +325,6 @@ class Gif:
             Union[bool, bytearray]: False if there's an error, otherwise returns bytearray payload
         """
         try:
-            import asyncio
             loop = asyncio.get_event_loop()
             data = await loop.run_in_executor(None, self._processGif, file_path, pixel_size, index, interval)
 
@@ -191,49 +333,56 @@ class Gif:
 
             if self.conn:
                 await self.conn.connect()
-                for chunk in data:
-                    result = await self.conn.send(data=chunk, response=True)
-                    if not result:
-                        self.logging.error("Send failed during GIF upload")
-                        return False
+                async with self.conn.transfer():
+                    for chunk in data:
+                        result = await self.conn.send(
+                            data=chunk, response=True, priority=PRIORITY_BULK
+                        )
+                        if not result:
+                            self.logging.error("Send failed during GIF upload")
+                            return False
                 self.logging.debug(f"GIF upload complete: {len(data)} chunks sent")
             return data
         except BaseException as error:
             self.logging.error(f"could not upload gif processed: {error}")
             return False
 
-    async def uploadSingleRaw(self, file_path: str) -> bool:
+    async def uploadSingleRaw(self, file_path: str, pixel_size: int = 32) -> bool:
         """Upload a single raw GIF using the single upload protocol (no batch commands).
 
         Uses index=0x0d which tells the device this is a standalone GIF, giving
         it access to the full GIF buffer (not the smaller per-slot batch buffer).
+        Files larger than that buffer are optimized to fit first.
 
         Args:
             file_path: Path to the GIF file.
+            pixel_size: Pixel size used if the GIF has to be optimized. Defaults to 32.
 
         Returns:
             True if successful, False on error.
         """
-        import asyncio
-
         try:
             if not self.conn:
                 return False
 
             await self.conn.connect()
 
-            loop = asyncio.get_event_loop()
-            gif_data = await loop.run_in_executor(None, self._load, file_path)
+            gif_data = await self._transcodeAsync(
+                file_path, pixel_size, self.SINGLE_UPLOAD_BUDGET, raw=True
+            )
             data = self._createPayloads(gif_data, index=0x0d)
 
-            for chunk in data:
-                # Use response=True for flow control through BLE proxy.
-                # Without it, the proxy's BLE transmit buffer overflows for
-                # large files and silently drops packets.  Slower but reliable.
-                result = await self.conn.send(data=chunk, response=True)
-                if not result:
-                    self.logging.error("Send failed during single GIF upload")
-                    return False
+            async with self.conn.transfer():
+                for chunk in data:
+                    # Use response=True for flow control through BLE proxy.
+                    # Without it, the proxy's BLE transmit buffer overflows for
+                    # large files and silently drops packets.  Slower but reliable.
+                    result = await self.conn.send(
+                        data=chunk, response=True, priority=PRIORITY_BULK
+                    )
+                    if not result:
+                        self.logging.error("Send failed during single GIF upload")
+                        return False
 
             self.logging.debug(f"Single GIF upload complete: {len(data)} chunks, {len(gif_data)} bytes")
             return True
@@ -260,8 +409,6 @@ class Gif:
         Returns:
             True if successful, False on error.
         """
-        import asyncio
-
         if not file_paths:
             return False
 
@@ -269,52 +416,63 @@ class Gif:
         file_paths = file_paths[:12]
         count = len(file_paths)
 
+        # Load or transcode all GIFs up front; the process pool bounds the
+        # parallelism. Results are consumed in index order, so preparing
+        # GIF N+1 overlaps sending GIF N.
+        # With raw, files are sent without Pillow re-encoding unless they
+        # exceed the batch slot
+        jobs = [
+            asyncio.ensure_future(
+                self._transcodeAsync(file_path, pixel_size, self.BATCH_SLOT_BUDGET, raw)
+            )
+            for file_path in file_paths
+        ]
+
         try:
             if not self.conn:
                 return False
 
             await self.conn.connect()
 
-            # 1. Send batch mode enable: 04 00 0a 01
-            batch_enable = bytearray([0x04, 0x00, 0x0a, 0x01])
-            await self.conn.send(data=batch_enable)
-            # Brief pause for device to process command
-            await asyncio.sleep(0.1)
-
-            # 2. Send batch header with count and indices
-            # Format: [length, 0x00, 0x02, 0x01, count, idx0, idx1, ...]
-            batch_header = bytearray([0x00, 0x00, 0x02, 0x01, count])
-            batch_header.extend(range(count))
-            batch_header[0] = len(batch_header) & 0xFF
-            batch_header[1] = (len(batch_header) >> 8) & 0xFF
-            await self.conn.send(data=batch_header)
-            await asyncio.sleep(0.1)
-
-            # 3. Process and stream all GIFs with BLE-paced writes
-            loop = asyncio.get_event_loop()
-            for i, file_path in enumerate(file_paths):
-                if raw:
-                    # Send raw file bytes without Pillow re-encoding
-                    gif_data = await loop.run_in_executor(None, self._load, file_path)
+            async with self.conn.transfer():
+                # 1. Send batch mode enable: 04 00 0a 01
+                batch_enable = bytearray([0x04, 0x00, 0x0a, 0x01])
+                await self.conn.send(data=batch_enable)
+                # Brief pause for device to process command
+                await asyncio.sleep(0.1)
+
+                # 2. Send batch header with count and indices
+                # Format: [length, 0x00, 0x02, 0x01, count, idx0, idx1, ...]
+                batch_header = bytearray([0x00, 0x00, 0x02, 0x01, count])
+                batch_header.extend(range(count))
+                batch_header[0] = len(batch_header) & 0xFF
+                batch_header[1] = (len(batch_header) >> 8) & 0xFF
+                await self.conn.send(data=batch_header)
+                await asyncio.sleep(0.1)
+
+                # 3. Stream all GIFs with BLE-paced writes
+                for i, file_path in enumerate(file_paths):
+                    try:
+                        gif_data = await jobs[i]
+                    except asyncio.CancelledError:
+                        raise
+                    except BaseException as error:
+                        self.logging.error(f"Failed to process GIF {i}: {file_path}: {error}")
+                        return False
                     data = self._createPayloads(gif_data, index=i, interval=interval)
-                else:
-                    data = await loop.run_in_executor(
-                        None, self._processGif, file_path, pixel_size, i, interval
-                    )
-                if data is False:
-                    self.logging.error(f"Failed to process GIF {i}: {file_path}")
-                    return False
 
-                for chunk in data:
-                    result = await self.conn.send(data=chunk, response=True)
-                    if not result:
-                        self.logging.error(f"Send failed at GIF {i}")
-                        return False
+                    for chunk in data:
+                        result = await self.conn.send(
+                            data=chunk, response=True, priority=PRIORITY_BULK
+                        )
+                        if not result:
+                            self.logging.error(f"Send failed at GIF {i}")
+                            return False
 
-                self.logging.debug(f"GIF {i+1}/{count} uploaded ({len(data)} chunks, {'raw' if raw else 'processed'})")
-                # Brief pause between GIF files (~100-150ms seen in Android capture)
-                if i < count - 1:
-                    await asyncio.sleep(0.15)
+                    self.logging.debug(f"GIF {i+1}/{count} uploaded ({len(data)} chunks, {'raw' if raw else 'processed'})")
+                    # Brief pause between GIF files (~100-150ms seen in Android capture)
+                    if i < count - 1:
+                        await asyncio.sleep(0.15)
 
             self.logging.debug(f"Batch upload complete: {count} GIFs, interval={interval}s")
             return True
@@ -322,3 +480,11 @@ class Gif:
         except BaseException as error:
             self.logging.error(f"Batch upload failed: {error}")
             return False
+        finally:
+            # Stop the jobs an early return left behind, and collect the
+            # errors of finished ones so they are not logged as unretrieved
+            for job in jobs:
+                if not job.done():
+                    job.cancel()
+                elif not job.cancelled():
+                    job.exception()
@@ -8,8 +8,8 @@ class Graffiti:
 
     logging = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def setPixel(
         self, r: int, g: int, b: int, x: int, y: int
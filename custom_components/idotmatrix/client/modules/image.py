@@ -1,5 +1,6 @@
-from typing import Union, List
-from ..connectionManager import ConnectionManager
+from typing import Union, List, Optional
+from ..connectionManager import ConnectionManager, PRIORITY_BULK
+import asyncio
 import io
 import logging
 from PIL import Image as PilImage
@@ -9,8 +10,8 @@ import zlib
 class Image:
     logging = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def setMode(self, mode: int = 1) -> Union[bool, bytearray]:
         """Enter the DIY draw mode of the iDotMatrix device.
@@ -27,6 +28,8 @@ class Image:
                 await self.conn.connect()
                 await self.conn.send(data=data)
             return data
+        except asyncio.CancelledError:
+            raise
         except BaseException as error:
             self.logging.error(f"could not enter image mode due to {error}")
             return False
@@ -91,37 +94,76 @@ class Image:
             chunks.append(bytearray(header) + chunk)
         return chunks
 
-    async def uploadUnprocessed(self, file_path: str) -> Union[bool, bytearray]:
-        """Uploads an image without further checks and resizes.
+    @staticmethod
+    def toRaw(img: PilImage.Image, pixel_size: Optional[int] = None) -> bytearray:
+        """Convert a PIL image to the raw RGB buffer the device expects.
+
+        The result can be passed to uploadRaw, e.g. after checking whether
+        the frame changed.
 
         Args:
-            file_path (str): path to the image file
+            img (PilImage.Image): source image
+            pixel_size (int, optional): resize to pixel_size x pixel_size if given
 
         Returns:
-            Union[bool, bytearray]: False if there's an error, otherwise returns bytearray payload
+            bytearray: raw RGB pixel data (W*H*3 bytes)
         """
-        try:
-            import asyncio
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        if pixel_size and img.size != (pixel_size, pixel_size):
+            img = img.resize((pixel_size, pixel_size), PilImage.LANCZOS)
+        return bytearray(img.tobytes())
 
-            def load_raw_rgb(path):
-                with PilImage.open(path) as img:
-                    img = img.convert("RGB")
-                    return bytearray(img.tobytes())
+    def _loadRaw(self, file_path: str, pixel_size: Optional[int] = None) -> bytearray:
+        """Load an image file and convert it to a raw RGB buffer (sync)."""
+        with PilImage.open(file_path) as img:
+            return self.toRaw(img, pixel_size)
+
+    async def uploadRaw(self, raw_data: Union[bytes, bytearray]) -> Union[bool, List[bytearray]]:
+        """Uploads a raw RGB buffer that already matches the screen size.
+
+        Args:
+            raw_data (Union[bytes, bytearray]): raw RGB pixel data (W*H*3 bytes)
 
-            raw_data = await asyncio.to_thread(load_raw_rgb, file_path)
-            data = self._createPayloads(raw_data)
+        Returns:
+            Union[bool, List[bytearray]]: False if there's an error, otherwise returns the payloads
+        """
+        try:
+            data = self._createPayloads(bytearray(raw_data))
             if self.conn:
                 await self.conn.connect()
-                for chunk in data:
-                    await self.conn.send(data=chunk)
+                async with self.conn.transfer():
+                    for chunk in data:
+                        await self.conn.send(data=chunk, priority=PRIORITY_BULK)
             return data
+        except asyncio.CancelledError:
+            # Superseded by a newer upload, stop at the chunk boundary
+            raise
+        except BaseException as error:
+            self.logging.error(f"could not upload the raw image: {error}")
+            return False
+
+    async def uploadUnprocessed(self, file_path: str) -> Union[bool, List[bytearray]]:
+        """Uploads an image without further checks and resizes.
+
+        Args:
+            file_path (str): path to the image file
+
+        Returns:
+            Union[bool, List[bytearray]]: False if there's an error, otherwise returns the payloads
+        """
+        try:
+            raw_data = await asyncio.to_thread(self._loadRaw, file_path)
+        except asyncio.CancelledError:
+            raise
         except BaseException as error:
             self.logging.error(f"could not upload the unprocessed image: {error}")
             return False
+        return await self.uploadRaw(raw_data)
 
     async def uploadProcessed(
         self, file_path: str, pixel_size: int = 32
-    ) -> Union[bool, bytearray]:
+    ) -> Union[bool, List[bytearray]]:
         """Uploads a file processed and makes sure everything is correct before uploading to the device.
 
         Args:
@@ -129,29 +171,13 @@ class Image:
             pixel_size (int, optional): amount of pixels (either 16 or 32 makes sense). Defaults to 32.
 
         Returns:
-            Union[bool, bytearray]: False if there's an error, otherwise returns bytearray payload
+            Union[bool, List[bytearray]]: False if there's an error, otherwise returns the payloads
         """
         try:
-            import asyncio
-
-            def process_image_sync():
-                with PilImage.open(file_path) as img:
-                    img = img.convert("RGB")
-                    if img.size != (pixel_size, pixel_size):
-                        img = img.resize(
-                            (pixel_size, pixel_size), PilImage.LANCZOS
-                        )
-                    # Return raw RGB pixel data (W*H*3 bytes)
-                    return bytearray(img.tobytes())
-
-            raw_data = await asyncio.to_thread(process_image_sync)
-            data = self._createPayloads(raw_data)
-
-            if self.conn:
-                await self.conn.connect()
-                for chunk in data:
-                    await self.conn.send(data=chunk)
-            return data
+            raw_data = await asyncio.to_thread(self._loadRaw, file_path, pixel_size)
+        except asyncio.CancelledError:
+            raise
         except BaseException as error:
             self.logging.error(f"could not upload processed image: {error}")
             return False
+        return await self.uploadRaw(raw_data)
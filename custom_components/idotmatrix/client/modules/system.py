@@ -9,8 +9,8 @@ class System:
 
     logging = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def deleteDeviceData(self) -> bytearray:
         """Deletes the device data and resets it to defaults.
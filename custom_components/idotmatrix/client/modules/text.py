@@ -1,9 +1,14 @@
 from ..connectionManager import ConnectionManager
+from ..fontCache import FontCache
 import logging
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 from typing import Tuple, Optional, Union
 import zlib
 
+# Maps every byte to its bit-reversed value. Pillow packs "1" images MSB
+# first, the device expects the leftmost pixel in the least significant bit.
+_REVERSED_BITS = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
 
 class Text:
     """Manages text processing and packet creation for iDotMatrix devices. With help from https://github.com/8none1/idotmatrix/ :)"""
@@ -15,8 +20,8 @@ class Text:
     # must be x05 for 16x32 or x02 for 8x16
     separator = b"\x05\xff\xff\xff"
 
-    def __init__(self) -> None:
-        self.conn: ConnectionManager = ConnectionManager()
+    def __init__(self, conn: ConnectionManager) -> None:
+        self.conn: ConnectionManager = conn
 
     async def setMode(
         self,
@@ -146,71 +151,35 @@ class Text:
 
         return header + packet
 
+    def _packBitmap(self, image: Image.Image) -> bytes:
+        """Packs a 1-bit glyph tile into the device's bitmap format.
+
+        Rows are padded to whole bytes and the leftmost pixel of each byte is
+        stored in its least significant bit.
+        """
+        return image.tobytes().translate(_REVERSED_BITS)
+
     def _StringToBitmaps(
         self, text: str, font_path: Optional[str] = None, font_size: Optional[int] = 20,
         image_width: int = 16, image_height: int = 32, separator: bytes = b"\x05\xff\xff\xff",
         spacing: int = 0, proportional: bool = True
     ) -> bytearray:
         """Converts text to bitmap images suitable for iDotMatrix devices."""
-        import os
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        fonts_dir = os.path.join(base_path, "fonts")
-        
-        if not font_path:
-            # using open source font from https://www.fontspace.com/rain-font-f22577
-            font_path = os.path.join(fonts_dir, "Rain-DRM3.otf")
-        elif not os.path.isabs(font_path) and not os.path.exists(font_path):
-            # Check if it's in the fonts dir
-            potential_path = os.path.join(fonts_dir, font_path)
-            if os.path.exists(potential_path):
-                font_path = potential_path
-        if font_path and not os.path.exists(font_path):
-            self.logging.warning(
-                "Font path %s not found, falling back to Rain-DRM3.otf",
-                font_path,
-            )
-            font_path = os.path.join(fonts_dir, "Rain-DRM3.otf")
-        
-        if font_path:
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-            except Exception as exc:
-                self.logging.warning(
-                    "Failed to load font %s, falling back to default: %s",
-                    font_path,
-                    exc,
-                )
-                try:
-                    font = ImageFont.truetype(
-                        os.path.join(fonts_dir, "Rain-DRM3.otf"), font_size
-                    )
-                except Exception:
-                    font = ImageFont.load_default()
-        else:
-            font = ImageFont.load_default()
+        font = FontCache.getFont(font_path, font_size)
         byte_stream = bytearray()
         
         if not proportional:
             # Legacy Fixed Width Logic
             for char in text:
                 image = Image.new("1", (image_width, image_height), 0)
-                draw = ImageDraw.Draw(image)
+                glyph = FontCache.getGlyph(font, char, mode="1")
                 
-                _, _, text_width, text_height = draw.textbbox((0, 0), text=char, font=font)
+                _, _, text_width, text_height = glyph.bbox
                 text_x = (image_width - text_width) // 2
                 text_y = (image_height - text_height) // 2
-                draw.text((text_x, text_y), char, fill=1, font=font)
+                FontCache.drawGlyph(image, (text_x, text_y), glyph, fill=1)
                 
-                bitmap = bytearray()
-                for y in range(image_height):
-                    for x in range(image_width):
-                        if x % 8 == 0:
-                            byte = 0
-                        pixel = image.getpixel((x, y))
-                        byte |= (pixel & 1) << (x % 8)
-                        if x % 8 == 7 or x == image_width - 1:
-                            bitmap.append(byte)
-                byte_stream.extend(separator + bitmap)
+                byte_stream.extend(separator + self._packBitmap(image))
             return byte_stream
             
         else:
@@ -230,35 +199,28 @@ class Text:
             max_h = image_height
             
             for char in text:
-                 # get size
-                 # Use dummy draw
-                 dummy = Image.new("1", (1, 1), 0)
-                 d = ImageDraw.Draw(dummy)
-                 bbox = d.textbbox((0, 0), text=char, font=font)
-                 w = bbox[2] - bbox[0]
-                 # h = bbox[3] - bbox[1] # ignore height, use max
-                 char_images.append((char, w))
+                 # get size from the cached monochrome glyph
+                 glyph = FontCache.getGlyph(font, char, mode="1")
+                 char_images.append((glyph, glyph.width))
                  
-            total_width = sum([w + spacing for char, w in char_images])
+            total_width = sum([w + spacing for glyph, w in char_images])
             # Ensure width is at least one block?
             if total_width < image_width:
                 total_width = image_width
                 
             # Create big canvas
             canvas = Image.new("1", (total_width, image_height), 0)
-            draw = ImageDraw.Draw(canvas)
             
             current_x = 0
-            for char, w in char_images:
+            for glyph, w in char_images:
                 # Vertically center?
-                bbox = draw.textbbox((0, 0), text=char, font=font)
-                h = bbox[3] - bbox[1]
+                h = glyph.height
                 y = (image_height - h) // 2
                 # Correct Y using font metrics if possible for baseline consistency, but centering per char is safer for pixel fonts
                 # Actually, standard draw.text usually handles baseline.
                 # If we center each char vertically independently, it might look jumpy.
                 # Better to use a constant Y for the whole line.
-                draw.text((current_x, y), char, fill=1, font=font)
+                FontCache.drawGlyph(canvas, (current_x, y), glyph, fill=1)
                 current_x += w + spacing
                 
             # Slice into chunks of image_width (16)
@@ -273,15 +235,6 @@ class Text:
                     chunk = tmp
                     
                 # Convert to bitmap
-                bitmap = bytearray()
-                for y in range(image_height):
-                    for x in range(image_width):
-                        if x % 8 == 0:
-                            byte = 0
-                        pixel = chunk.getpixel((x, y))
-                        byte |= (pixel & 1) << (x % 8)
-                        if x % 8 == 7 or x == image_width - 1:
-                            bitmap.append(byte)
-                byte_stream.extend(separator + bitmap)
+                byte_stream.extend(separator + self._packBitmap(chunk))
                 
             return byte_stream
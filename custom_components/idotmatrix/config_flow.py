@@ -17,6 +17,8 @@ from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
     CONF_DISPLAY_MODE,
+    CONF_GIF_DELTA,
+    DEFAULT_GIF_DELTA,
     DEFAULT_NAME,
     DISPLAY_MODE_DESIGN,
     DISPLAY_MODE_OPTIONS,
@@ -129,11 +131,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
 
         current = self.config_entry.options.get(CONF_DISPLAY_MODE, DISPLAY_MODE_DESIGN)
+        gif_delta = self.config_entry.options.get(CONF_GIF_DELTA, DEFAULT_GIF_DELTA)
         schema = vol.Schema(
             {
                 vol.Required(CONF_DISPLAY_MODE, default=current): vol.In(
                     DISPLAY_MODE_OPTIONS
-                )
+                ),
+                vol.Required(CONF_GIF_DELTA, default=gif_delta): bool,
             }
         )
 
@@ -14,6 +14,10 @@ STORAGE_KEY_PREFIX = "idotmatrix_settings_"
 # New Constants for Display Face
 CONF_DISPLAY_FACE = "display_face"
 CONF_DISPLAY_MODE = "display_mode"
+# Transcode GIFs into delta frames; off writes full frames for firmwares that
+# do not render delta frames correctly
+CONF_GIF_DELTA = "gif_delta_frames"
+DEFAULT_GIF_DELTA = True
 
 DISPLAY_MODE_TEXT = "text"
 DISPLAY_MODE_DESIGN = "design"
@@ -4,6 +4,8 @@ from __future__ import annotations
 import logging
 import asyncio
 import re
+import json
+import time
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
@@ -12,9 +14,17 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from homeassistant.helpers.event import async_track_state_change_event
-
-from .const import DOMAIN, CONF_DISPLAY_MODE, DISPLAY_MODE_DESIGN, DISPLAY_MODE_TEXT
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+
+from .const import (
+    DOMAIN,
+    CONF_MAC,
+    CONF_DISPLAY_MODE,
+    CONF_GIF_DELTA,
+    DEFAULT_GIF_DELTA,
+    DISPLAY_MODE_DESIGN,
+    DISPLAY_MODE_TEXT,
+)
 from .client.connectionManager import ConnectionManager
 from bleak.exc import BleakError
 from .client.modules.text import Text
@@ -22,22 +32,51 @@ from .client.modules.image import Image as IDMImage
 from .client.modules.gif import Gif as IDMGif
 from .client.modules.clock import Clock
 from .client.modules.fullscreenColor import FullscreenColor
+from .client.fontCache import FontCache
+from .cache import MISSING, BoundedCache
 
 
 from homeassistant.helpers import template
 from homeassistant.util import dt as dt_util
 
 import os
-import tempfile
 import io
+import zlib
 import random
-from PIL import Image, ImageDraw, ImageFont
+import functools
+import hashlib
+from collections import OrderedDict
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 MDI_META_URL = "https://raw.githubusercontent.com/Templarian/MaterialDesign/master/meta.json"
 MDI_FONT_URL = "https://raw.githubusercontent.com/Templarian/MaterialDesign-Webfont/master/fonts/materialdesignicons-webfont.ttf"
+# MDI assets are cached below the config dir. A copy with the same layout can
+# be bundled in the integration's "mdi" folder as an offline fallback, see
+# fetch_mdi_assets.sh.
+MDI_CACHE_DIR = (".storage", "idotmatrix", "mdi")
+MDI_BUNDLED_DIR = os.path.join(os.path.dirname(__file__), "mdi")
+MDI_META_FILE = "meta.json"
+MDI_FONT_FILE = "materialdesignicons-webfont.ttf"
+MDI_INFO_FILE = "cache.json"
+MDI_REVALIDATE_INTERVAL = 7 * 24 * 3600
+MDI_FONT_CACHE_MAX_ENTRIES = 8
+MDI_FONT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Rendered icon cache bounds, and how long failed icons are not retried
+ICON_CACHE_MAX_ENTRIES = 256
+ICON_CACHE_MAX_BYTES = 4 * 1024 * 1024
+ICON_NEGATIVE_TTL = 300
+# Number of icons fetched in parallel
+ICON_FETCH_CONCURRENCY = 4
+# Rasterized remote icons are persisted below the config dir and refetched
+# once they are older than ICON_STORE_MAX_AGE. Stale icons are deleted, and
+# the oldest ones once the store grows beyond ICON_STORE_MAX_BYTES.
+ICON_STORE_DIR = (".storage", "idotmatrix", "icons")
+ICON_STORE_MAX_AGE = 30 * 24 * 3600
+ICON_STORE_MAX_BYTES = 8 * 1024 * 1024
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,8 +84,150 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_VERSION = 1
 STORAGE_KEY_PREFIX = "idotmatrix_settings_"
 
+# Number of rasterized layers kept for reuse across face renders
+LAYER_CACHE_SIZE = 64
+# Number of decoded image layers kept, and how long media images are trusted
+# before being revalidated
+IMAGE_CACHE_SIZE = 16
+MEDIA_IMAGE_TTL = 300
+
 # Regex to extract entity IDs from Jinja templates
-ENTITY_REGEX = re.compile(r"states\(['\"]([a-z_]+\.[a-z0-9_]+)['\"]\)")
+ENTITY_REGEX = re.compile(
+    r"(?:states|is_state|state_attr|is_state_attr)\(['\"]([a-z_]+\.[a-z0-9_]+)['\"]"
+)
+
+# Layer fields that may reference entities
+LAYER_DEPENDENCY_FIELDS = ("content", "template", "icon_template", "condition_template")
+
+
+@functools.lru_cache(maxsize=None)
+def _sharpen_lut(blur: int) -> list[int]:
+    """Return the contrast table used to sharpen text coverage for blur < 5."""
+    gain = 1.0 + ((5 - blur) * 2.0)
+    return [max(0, min(255, int((p - 128) * gain + 128))) for p in range(256)]
+
+
+@functools.lru_cache(maxsize=None)
+def _blur_filter(blur: int) -> ImageFilter.GaussianBlur:
+    """Return the Gaussian blur filter used for blur > 5."""
+    return ImageFilter.GaussianBlur(radius=(blur - 5) * 0.5)  # 0.5 to 2.5 radius
+
+
+def _apply_text_blur(mask: Image.Image, blur: int) -> Image.Image:
+    """Apply the text blur/sharpness effect (0=Sharp, 5=Normal, 10=Blur) to a coverage mask."""
+    if blur < 5:
+        # Sharpen via contrast enhancement of the coverage
+        return mask.point(_sharpen_lut(blur))
+    if blur > 5:
+        return mask.filter(_blur_filter(blur))
+    return mask
+
+
+def _rasterize_text(
+    content: str,
+    font_name: str,
+    font_size: int,
+    spacing_x: int,
+    blur: int,
+    x: int,
+    y: int,
+    screen_size: int,
+) -> tuple[Image.Image, tuple[int, int, int, int]] | None:
+    """Rasterize a text layer into its coverage mask.
+
+    Returns the mask cropped to the covered area together with its box on the
+    screen, or None if the text leaves no visible pixels.
+    """
+    font = FontCache.getFont(font_name, font_size)
+
+    # Render the text coverage into a separate alpha mask to apply blur/sharpness
+    text_mask = Image.new("L", (screen_size, screen_size), 0)
+
+    # Character-by-character rendering with custom spacing, blitting cached glyphs
+    current_x = x
+    for char in content:
+        try:
+            glyph = FontCache.getGlyph(font, char)
+        except Exception:
+            current_x += font_size // 2 + spacing_x
+            continue
+        FontCache.drawGlyph(text_mask, (current_x, y), glyph)
+        current_x += glyph.width + spacing_x
+
+    # Apply blur/sharpness effect (0=Sharp, 5=Normal, 10=Blur)
+    text_mask = _apply_text_blur(text_mask, blur)
+
+    box = text_mask.getbbox()
+    if box is None:
+        return None
+    return text_mask.crop(box), box
+
+
+# Marks a text draw operation whose raster is not cached yet
+_NOT_RASTERIZED = object()
+
+
+def _rasterize_face(
+    ops: list[tuple], screen_size: int
+) -> tuple[Image.Image, dict[tuple, tuple | None]]:
+    """Composite resolved face layers onto a canvas (executor).
+
+    Text operations without a cached raster are rasterized here and returned
+    keyed by their cache key so the caller can store them.
+    """
+    # Create base canvas
+    canvas = Image.new("RGB", (screen_size, screen_size), (0, 0, 0))
+    rasters: dict[tuple, tuple | None] = {}
+
+    for op in ops:
+        kind = op[0]
+        if kind == "icon":
+            _, icon_img, xy, color = op
+            if icon_img is None:
+                continue
+            r, g, b, a = icon_img.split()
+            colored_icon = Image.new("RGB", icon_img.size, color)
+            canvas.paste(colored_icon, xy, mask=a)
+        elif kind == "text":
+            _, key, color, raster = op
+            if raster is _NOT_RASTERIZED:
+                raster = rasters[key] if key in rasters else _rasterize_text(*key)
+                rasters[key] = raster
+            if raster:
+                # Composite text onto canvas with color
+                mask, box = raster
+                canvas.paste(color, box, mask)
+        elif kind == "image":
+            _, img, xy = op
+            try:
+                canvas.paste(img, xy, img)
+            except Exception as e:
+                _LOGGER.error(f"Failed to process image layer: {e}")
+
+    return canvas, rasters
+
+
+def _rasterize_mdi_icon(
+    font_bytes: bytes,
+    font: ImageFont.FreeTypeFont | None,
+    char: str,
+    size: int,
+) -> tuple[Image.Image, ImageFont.FreeTypeFont]:
+    """Draw an MDI glyph centered on a transparent square (executor).
+
+    Parses the font from font_bytes if it is not given. Returns the icon and
+    the font so the caller can cache it.
+    """
+    if font is None:
+        font = ImageFont.truetype(io.BytesIO(font_bytes), size)
+
+    icon_img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(icon_img)
+    bbox = draw.textbbox((0, 0), char, font=font)
+    x = (size - (bbox[2] - bbox[0])) // 2 - bbox[0]
+    y = (size - (bbox[3] - bbox[1])) // 2 - bbox[1]
+    draw.text((x, y), char, font=font, fill=(255, 255, 255, 255))
+    return icon_img, font
 
 
 class IDotMatrixCoordinator(DataUpdateCoordinator):
@@ -61,14 +242,29 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=60),
         )
         self.entry = entry
+        # Each device gets its own BLE connection so several panels can be
+        # driven concurrently.
+        self.conn = ConnectionManager.for_address(entry.data[CONF_MAC], hass)
         self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_PREFIX}{entry.entry_id}")
         self._entity_unsubs: list = []  # Entity state change unsubscribe callbacks
         self.display_mode = entry.options.get(CONF_DISPLAY_MODE, DISPLAY_MODE_DESIGN)
+        self.gif_delta = entry.options.get(CONF_GIF_DELTA, DEFAULT_GIF_DELTA)
         self._svg_error_logged = False
-        self._icon_cache: dict[tuple[str, int], Image.Image | None] = {}
+        # Rendered icons by (ref, size); failures are cached for a while too
+        self._icon_cache = BoundedCache(
+            ICON_CACHE_MAX_ENTRIES,
+            ICON_CACHE_MAX_BYTES,
+            sizeof=lambda img: img.width * img.height * len(img.getbands()),
+            negative_ttl=ICON_NEGATIVE_TTL,
+        )
         self._mdi_meta: dict[str, str] | None = None
         self._mdi_font_bytes: bytes | None = None
-        self._mdi_fonts: dict[int, ImageFont.FreeTypeFont] = {}
+        # Every MDI font size holds its own copy of the webfont
+        self._mdi_fonts = BoundedCache(
+            MDI_FONT_CACHE_MAX_ENTRIES,
+            MDI_FONT_CACHE_MAX_BYTES,
+            sizeof=lambda font: len(self._mdi_font_bytes or b""),
+        )
         self._mdi_lock = asyncio.Lock()
         self._mdi_error_logged = False
         self._mdi_unknown_icons: set[str] = set()
@@ -77,6 +273,51 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         self._gif_rotation_task: asyncio.Task | None = None
         self._gif_rotation_stop = asyncio.Event()
 
+        # Latest-wins frame delivery: a newer frame cancels older ones
+        self._refresh_task: asyncio.Task | None = None
+        self._frame_upload_task: asyncio.Task | None = None
+        # CRC32 of the last payload delivered per content type, with the
+        # connection generation it was sent on
+        self._last_payload_crc: dict[str, tuple[int, int]] = {}
+        self._frame_upload_crc: int | None = None
+
+        # Coalescing of entity-triggered re-renders
+        self._refresh_unsub = None
+        self._pending_events = 0
+        self._last_refresh = 0.0
+        self.refresh_stats = {
+            "events": 0,
+            "refreshes": 0,
+            "coalesced": 0,
+            "layers_resolved": 0,
+            "layers_reused": 0,
+        }
+
+        # Which face layers depend on which entity, so a state change only
+        # re-resolves the layers that reference it
+        self._layer_deps: dict[str, set[int]] = {}
+        self._volatile_layers: set[int] = set()  # templates without known entities
+        self._trigger_entities: set[str] = set()
+        # Resolved (content, icon) of each face layer, None if hidden by its
+        # condition. Entries are dropped when an entity they depend on changes.
+        self._resolved_layers: dict[int, tuple | None] = {}
+
+        # Jinja templates of the active face, compiled once per face and keyed
+        # by their source, with render timings per template
+        self._face_templates: dict[str, template.Template] = {}
+        self.template_stats: dict[str, dict] = {}
+
+        # Rasterized text layers keyed by everything that affects their pixels,
+        # so unchanged layers are composited without being rendered again
+        self._layer_cache: OrderedDict[tuple, tuple[Image.Image, tuple] | None] = OrderedDict()
+        self.layer_cache_stats = {"hits": 0, "misses": 0}
+
+        # Decoded image layers keyed by (path or media id, size), stored as
+        # (image, validator, expiry) where the validator is the file path and
+        # mtime or the media ETag
+        self._image_cache: OrderedDict[tuple, tuple[Image.Image, object, float]] = OrderedDict()
+        self.image_cache_stats = {"hits": 0, "misses": 0}
+
         # Shared settings for Text entity
         self.text_settings = {
             "current_text": "",   # The actual text content
@@ -100,6 +341,8 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             "autosize": False,    # Auto-scale font to fit screen
             "mode": "basic",      # basic | advanced
             "layers": [],         # List of layers for advanced mode
+            "refresh_coalesce": 0.5,    # Seconds to gather entity changes into one refresh
+            "refresh_min_interval": 1.0,# Minimum seconds between entity-triggered refreshes
         }
         
     async def async_set_face_config(self, face_config: dict) -> None:
@@ -111,16 +354,62 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         self.text_settings["mode"] = "advanced"
         self.text_settings["layers"] = layers
 
+        self._compile_face_templates(layers)
         self._apply_face_tracking(face_config)
+        await self.async_prefetch_icons(layers)
         
         # Trigger initial update
         await self.async_update_device()
 
+    def _compile_face_templates(self, layers: list) -> None:
+        """Compile the Jinja templates of a face so renders can reuse them."""
+        self._face_templates = {}
+        self.template_stats = {}
+        for layer in layers:
+            for key in ("condition_template", "template", "icon_template"):
+                tpl_str = layer.get(key)
+                if not tpl_str or tpl_str in self._face_templates:
+                    continue
+                tpl = template.Template(tpl_str, self.hass)
+                try:
+                    tpl.ensure_valid()
+                except Exception as e:
+                    # Keep it anyway, rendering reports the error per frame
+                    _LOGGER.warning(f"Invalid template '{tpl_str}': {e}")
+                self._face_templates[tpl_str] = tpl
+
+    def _render_template(self, tpl_str: str) -> str:
+        """Render a template, reusing the compiled one if it belongs to the face.
+
+        Templates that are not part of the active face (e.g. previews) are
+        compiled on the fly and not timed.
+        """
+        tpl = self._face_templates.get(tpl_str)
+        if tpl is None:
+            return template.Template(tpl_str, self.hass).async_render(parse_result=False)
+
+        start = time.perf_counter()
+        try:
+            return tpl.async_render(parse_result=False)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats = self.template_stats.setdefault(
+                tpl_str, {"renders": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+            )
+            stats["renders"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            stats["last_ms"] = elapsed_ms
+
     def _clear_face_tracking(self) -> None:
         """Cancel any entity listeners for face updates."""
         for unsub in self._entity_unsubs:
             unsub()
         self._entity_unsubs = []
+        self._layer_deps = {}
+        self._volatile_layers = set()
+        self._trigger_entities = set()
+        self._resolved_layers = {}
 
     def _apply_face_tracking(self, face_config: dict) -> None:
         """Register entity listeners for advanced face updates."""
@@ -133,32 +422,37 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         if not layers:
             return
 
-        # Extract entity IDs from layers
-        entities_to_track = set()
-        for layer in layers:
+        # Index the entity IDs referenced by each layer
+        for index, layer in enumerate(layers):
             # Direct entity reference
             if entity := layer.get("entity"):
-                entities_to_track.add(entity)
+                self._layer_deps.setdefault(entity, set()).add(index)
 
             # Entity IDs in templates (e.g., {{ states('sensor.temp') }})
-            if content := layer.get("content"):
-                matches = ENTITY_REGEX.findall(content)
-                entities_to_track.update(matches)
-            if tpl := layer.get("template"):
-                matches = ENTITY_REGEX.findall(tpl)
-                entities_to_track.update(matches)
-            if icon_tpl := layer.get("icon_template"):
-                matches = ENTITY_REGEX.findall(icon_tpl)
-                entities_to_track.update(matches)
+            has_template = False
+            found = False
+            for field in LAYER_DEPENDENCY_FIELDS:
+                if not (value := layer.get(field)):
+                    continue
+                has_template = has_template or field != "content"
+                for entity_id in ENTITY_REGEX.findall(value):
+                    self._layer_deps.setdefault(entity_id, set()).add(index)
+                    found = True
+            if has_template and not found:
+                # e.g. {{ now().strftime('%H:%M') }}, re-resolve on every refresh
+                self._volatile_layers.add(index)
+
+        entities_to_track = set(self._layer_deps)
 
         # Add explicit trigger entity if specified (for time-based or other updates)
         if trigger := face_config.get("trigger_entity"):
             if isinstance(trigger, str) and trigger.strip():
-                entities_to_track.add(trigger.strip())
+                self._trigger_entities.add(trigger.strip())
             elif isinstance(trigger, list):
                 for t in trigger:
                     if t and t.strip():
-                        entities_to_track.add(t.strip())
+                        self._trigger_entities.add(t.strip())
+        entities_to_track.update(self._trigger_entities)
 
         # Set up state change listeners
         if entities_to_track:
@@ -180,78 +474,216 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
 
     @callback
     def _on_entity_state_change(self, event: Event) -> None:
-        """Handle entity state change by re-rendering face."""
+        """Handle entity state change by scheduling a coalesced re-render.
+
+        Changes arriving within the coalescing window are collapsed into a
+        single render and upload, and refreshes are spaced at least
+        ``refresh_min_interval`` seconds apart.
+        """
         entity_id = event.data.get("entity_id")
-        _LOGGER.debug(f"[iDotMatrix] Entity {entity_id} changed, re-rendering face")
-        # Schedule async update
-        self.hass.async_create_task(self.async_update_device())
+        _LOGGER.debug(f"[iDotMatrix] Entity {entity_id} changed, scheduling re-render")
+        self._pending_events += 1
+        self.refresh_stats["events"] += 1
+        if entity_id in self._trigger_entities or entity_id not in self._layer_deps:
+            self._resolved_layers.clear()
+        else:
+            for index in self._layer_deps[entity_id]:
+                self._resolved_layers.pop(index, None)
+        if self._refresh_unsub is not None:
+            # A refresh is already scheduled and will pick this change up
+            return
 
+        window = float(self.text_settings.get("refresh_coalesce", 0.5))
+        min_interval = float(self.text_settings.get("refresh_min_interval", 1.0))
+        next_allowed = self._last_refresh + min_interval - self.hass.loop.time()
+        self._refresh_unsub = async_call_later(
+            self.hass, max(window, next_allowed, 0), self._async_fire_refresh
+        )
 
-    async def _render_face(self, layers: list, screen_size: int) -> Image.Image:
-        """Render the advanced display face."""
-        # Create base canvas
-        canvas = Image.new("RGB", (screen_size, screen_size), (0, 0, 0))
-        draw = ImageDraw.Draw(canvas)
-        
-        # Load Fonts Cache (simple dict for now)
-        # We can reuse the font loading logic or abstract it
-        
-        for layer in layers:
-            # check conditions
-            if (cond_tpl := layer.get("condition_template")):
-                try:
-                    tpl = template.Template(cond_tpl, self.hass)
-                    if not tpl.async_render(parse_result=False):
-                        continue
-                except Exception as e:
-                    _LOGGER.warning(f"Error evaluating condition '{cond_tpl}': {e}")
-                    continue
+    @callback
+    def _async_fire_refresh(self, _now) -> None:
+        """Run the scheduled re-render for all coalesced entity changes."""
+        self._refresh_unsub = None
+        events = self._pending_events
+        self._pending_events = 0
+        self._last_refresh = self.hass.loop.time()
+        self.refresh_stats["refreshes"] += 1
+        self.refresh_stats["coalesced"] += max(events - 1, 0)
+        if events > 1:
+            _LOGGER.debug(f"[iDotMatrix] Coalesced {events} entity changes into one refresh")
+        # Drop a refresh that is still rendering, the new one supersedes it
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = self.hass.async_create_task(
+            self.async_update_device(reuse_resolved=True)
+        )
+
+    def _cancel_frame_tasks(self) -> None:
+        """Cancel any pending face refresh and in-flight frame upload."""
+        if self._refresh_unsub is not None:
+            self._refresh_unsub()
+            self._refresh_unsub = None
+        self._pending_events = 0
+        for task in (self._refresh_task, self._frame_upload_task):
+            if task and not task.done():
+                task.cancel()
+        self._refresh_task = None
+        self._frame_upload_task = None
+
+    def _frame_unchanged(self, content_type: str, crc: int) -> bool:
+        """Return True if the device already shows exactly this payload."""
+        client = self.conn.client
+        return (
+            client is not None
+            and client.is_connected
+            and self._last_payload_crc.get(content_type) == (crc, self.conn.generation)
+        )
+
+    def invalidate_frame_cache(self) -> None:
+        """Forget delivered payloads, e.g. because other content was shown."""
+        self._last_payload_crc.clear()
+
+    async def _async_upload_frame(self, image: Image.Image, screen_size: int) -> None:
+        """Upload a static frame, superseding any frame upload still in flight.
+
+        Frames that are byte-identical to the last one delivered are skipped.
+        Otherwise the previous upload is cancelled; the connection manager
+        completes the payload currently on the air, so the old transfer stops
+        at a chunk boundary and the link only carries the newest frame.
+        """
+        # Same CRC as Image._createPayloads computes over the raw RGB buffer
+        raw_data = IDMImage.toRaw(image, screen_size)
+        crc = zlib.crc32(raw_data)
+        if self._frame_unchanged("image", crc):
+            _LOGGER.debug("[iDotMatrix] Frame unchanged, skipping upload")
+            return
+
+        previous = self._frame_upload_task
+        if previous and not previous.done():
+            if self._frame_upload_crc == crc:
+                # The same frame is already on its way
+                await asyncio.wait([previous])
+                return
+            _LOGGER.debug("[iDotMatrix] Superseding in-flight frame upload")
+            previous.cancel()
+
+        async def _upload() -> None:
+            if previous:
+                await asyncio.wait([previous])
+            # The device content is unknown until this upload completes
+            self.invalidate_frame_cache()
+            # One transfer, so nothing gets between the mode switch and the image
+            async with self.conn.transfer():
+                await IDMImage(self.conn).setMode(1)
+                uploaded = await IDMImage(self.conn).uploadRaw(raw_data)
+            if uploaded:
+                self._last_payload_crc["image"] = (crc, self.conn.generation)
+
+        task = self.hass.async_create_task(_upload())
+        self._frame_upload_task = task
+        self._frame_upload_crc = crc
+        # Waiting does not cancel the upload if our caller is cancelled; the
+        # next frame will supersede it instead.
+        await asyncio.wait([task])
+
+
+    def _resolve_layer(self, layer: dict) -> tuple[str, str | None] | None:
+        """Resolve the dynamic parts of a layer: its condition, text and icon.
+
+        Returns (content, icon_ref), or None if the layer's condition hides it.
+        """
+        # check conditions
+        if (cond_tpl := layer.get("condition_template")):
+            try:
+                if not self._render_template(cond_tpl):
+                    return None
+            except Exception as e:
+                _LOGGER.warning(f"Error evaluating condition '{cond_tpl}': {e}")
+                return None
+
+        if layer.get("type", "text") != "text":
+            return "", None
+
+        content = ""
+        icon_ref = layer.get("icon")
+        icon_template = layer.get("icon_template")
+
+        # Priority: content (already resolved) > entity > template
+        if layer.get("content"):
+            # Content already resolved by frontend
+            content = layer.get("content", "")
+        elif entity_id := layer.get("entity"):
+            # Get state from entity
+            if state := self.hass.states.get(entity_id):
+                content = state.state
+            else:
+                content = "N/A"
+        elif layer.get("is_template", False) or layer.get("template"):
+            # Render Jinja template
+            tpl_str = layer.get("template") or ""
+            try:
+                content = self._render_template(tpl_str)
+            except Exception as e:
+                content = "ERR"
+                _LOGGER.warning(f"Error evaluating text template: {e}")
+
+        if not icon_ref and icon_template:
+            try:
+                icon_ref = self._render_template(icon_template)
+            except Exception as e:
+                _LOGGER.warning(f"Error evaluating icon template: {e}")
+
+        return content, icon_ref
+
+    async def _render_face(
+        self, layers: list, screen_size: int, reuse_resolved: bool = False
+    ) -> Image.Image:
+        """Render the advanced display face.
+
+        With reuse_resolved, layers of the active face keep their last resolved
+        content unless an entity they depend on changed since.
+        """
+        # Draw operations for the rasterizer, in layer order
+        ops: list[tuple] = []
+        icons: set[tuple[str, int]] = set()
+
+        # Only the active face is memoized, previews are resolved from scratch
+        resolved_layers = None
+        if layers is self.text_settings.get("layers"):
+            resolved_layers = self._resolved_layers
+            if not reuse_resolved:
+                resolved_layers.clear()
+
+        for index, layer in enumerate(layers):
+            if (
+                resolved_layers is not None
+                and index in resolved_layers
+                and index not in self._volatile_layers
+            ):
+                resolved = resolved_layers[index]
+                self.refresh_stats["layers_reused"] += 1
+            else:
+                resolved = self._resolve_layer(layer)
+                self.refresh_stats["layers_resolved"] += 1
+                if resolved_layers is not None:
+                    resolved_layers[index] = resolved
+            if resolved is None:
+                continue
+            content, icon_ref = resolved
 
             l_type = layer.get("type", "text")
             x = layer.get("x", 0)
             y = layer.get("y", 0)
             
             if l_type == "text":
-                content = ""
-                icon_ref = layer.get("icon")
                 icon_size = int(layer.get("icon_size", 16))
-                icon_template = layer.get("icon_template")
-                
-                # Priority: content (already resolved) > entity > template
-                if layer.get("content"):
-                    # Content already resolved by frontend
-                    content = layer.get("content", "")
-                elif entity_id := layer.get("entity"):
-                    # Get state from entity
-                    if state := self.hass.states.get(entity_id):
-                        content = state.state
-                    else:
-                        content = "N/A"
-                elif layer.get("is_template", False) or layer.get("template"):
-                    # Render Jinja template
-                    tpl_str = layer.get("template") or ""
-                    try:
-                        tpl = template.Template(tpl_str, self.hass)
-                        content = tpl.async_render(parse_result=False)
-                    except Exception as e:
-                        content = "ERR"
-                        _LOGGER.warning(f"Error evaluating text template: {e}")
-
-                if not icon_ref and icon_template:
-                    try:
-                        tpl = template.Template(icon_template, self.hass)
-                        icon_ref = tpl.async_render(parse_result=False)
-                    except Exception as e:
-                        _LOGGER.warning(f"Error evaluating icon template: {e}")
-                
-                # Render icon if present
-                if icon_ref:
-                    icon_img = await self._load_icon(icon_ref, icon_size)
-                    if icon_img:
-                        r, g, b, a = icon_img.split()
-                        color = tuple(layer.get("color", [255, 255, 255]))
-                        colored_icon = Image.new("RGB", icon_img.size, color)
-                        canvas.paste(colored_icon, (x, y), mask=a)
+
+                # Render icon if present, fetched below with all others
+                if icon_ref and icon_ref.strip():
+                    color = tuple(layer.get("color", [255, 255, 255]))
+                    icon_key = (icon_ref.strip(), icon_size)
+                    icons.add(icon_key)
+                    ops.append(("icon", icon_key, (x, y), color))
 
                 # Skip empty content
                 if not content:
@@ -265,145 +697,147 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
                 spacing_y = int(layer.get("spacing_y", 1))
                 blur = int(layer.get("blur", 5))
                 
-                # Resolve font path
-                base_path = os.path.dirname(os.path.abspath(__file__))
-                fonts_dir = os.path.join(base_path, "fonts")
-                font_path = os.path.join(fonts_dir, "Rain-DRM3.otf")
-                
-                if font_name:
-                    if not os.path.isabs(font_name):
-                         potential = os.path.join(fonts_dir, font_name)
-                         if os.path.exists(potential):
-                             font_path = potential
-                    elif os.path.exists(font_name):
-                        font_path = font_name
-                        
-                try:
-                    font = ImageFont.truetype(font_path, font_size)
-                except:
-                    font = ImageFont.load_default()
-                
-                # Create separate RGBA layer for text to apply blur/sharpness
-                text_layer = Image.new("RGBA", (screen_size, screen_size), (0, 0, 0, 0))
-                text_draw = ImageDraw.Draw(text_layer)
-                
-                # Character-by-character rendering with custom spacing
-                current_x = x
-                for char in str(content):
-                    text_draw.text((current_x, y), char, font=font, fill=(255, 255, 255, 255))
-                    # Get character width
-                    try:
-                        bbox = font.getbbox(char)
-                        char_width = bbox[2] - bbox[0] if bbox else font.getlength(char)
-                    except:
-                        char_width = font_size // 2
-                    current_x += int(char_width) + spacing_x
-                
-                # Apply blur/sharpness effect (0=Sharp, 5=Normal, 10=Blur)
-                if blur < 5:
-                    # Apply sharpening via contrast enhancement on alpha channel
-                    r, g, b, a = text_layer.split()
-                    gain = 1.0 + ((5 - blur) * 2.0)
-                    def apply_contrast(p):
-                        v = (p - 128) * gain + 128
-                        return max(0, min(255, int(v)))
-                    a = a.point(apply_contrast)
-                    text_layer.putalpha(a)
-                elif blur > 5:
-                    # Apply blur effect
-                    from PIL import ImageFilter
-                    blur_amount = (blur - 5) * 0.5  # 0.5 to 2.5 radius
-                    text_layer = text_layer.filter(ImageFilter.GaussianBlur(radius=blur_amount))
-                
-                # Composite text onto canvas with color
-                r, g, b, a = text_layer.split()
-                colored_text = Image.new("RGB", (screen_size, screen_size), color)
-                canvas.paste(colored_text, mask=a)
+                key = (str(content), font_name, font_size, spacing_x, blur, x, y, screen_size)
+                if key in self._layer_cache:
+                    self._layer_cache.move_to_end(key)
+                    self.layer_cache_stats["hits"] += 1
+                    ops.append(("text", key, color, self._layer_cache[key]))
+                else:
+                    self.layer_cache_stats["misses"] += 1
+                    ops.append(("text", key, color, _NOT_RASTERIZED))
 
             elif l_type == "image":
                  image_path = layer.get("image_path")
                  if not image_path: continue
                  
-                 img = None
-                 
-                 # Handle Media Source
-                 if image_path.startswith("media-source://"):
-                     try:
-                         from homeassistant.components import media_source
-                         # Resolve media source URL
-                         resolved = await media_source.async_resolve_media(self.hass, image_path, None)
-                         media_url = resolved.url
-                         
-                         # If it's a relative URL, prepend internal URL or handle locally
-                         # resolved.url is typically /media/...
-                         # We can fetch it via HTTP from localhost
-                         
-                         # However, if it maps to a file, maybe we can access directly? 
-                         # But abstracting via HTTP is safer for all media sources.
-                         
-                         # Use internal HTTP client to fetch
-                         from homeassistant.helpers.aiohttp_client import async_get_clientsession
-                         session = async_get_clientsession(self.hass)
-                         
-                         # Construct full URL if needed, but usually aiohttp handles relative to host if configured?
-                         # No, we need absolute URL or use loopback. 
-                         # Actually, HA's aiohttp client is for external. 
-                         # For internal, we might need to assume localhost.
-                         # Better: use hass.http?
-                         
-                         # Let's try to fetch relative URL using the server's port?
-                         # simpler: "http://127.0.0.1:8123" + media_url
-                         
-                         url = f"http://127.0.0.1:{self.hass.http.server_port}{media_url}"
-                         async with session.get(url) as resp:
-                             if resp.status == 200:
-                                 data = await resp.read()
-                                 import io
-                                 img = Image.open(io.BytesIO(data))
-                             else:
-                                 _LOGGER.error(f"Failed to fetch media: {resp.status}")
-                                 continue
-                     except Exception as e:
-                         _LOGGER.error(f"Error resolving media source {image_path}: {e}")
-                         continue
-
-                 else:
-                     # Legacy/Local path handling
-                     # Resolve path (Check 'www' or absolute)
-                     if not os.path.isabs(image_path):
-                         # Default to config/www/idotmatrix/
-                         base_www = self.hass.config.path("www", "idotmatrix")
-                         potential = os.path.join(base_www, image_path)
-                         if os.path.exists(potential):
-                             image_path = potential
-                         else:
-                             # Try locally in integration (bundled icons?)
-                             local = os.path.join(os.path.dirname(__file__), "images", image_path)
-                             if os.path.exists(local):
-                                 image_path = local
-                                 
-                     if os.path.exists(image_path):
-                         try:
-                            img = Image.open(image_path)
-                         except Exception as e:
-                             _LOGGER.error(f"Failed to load image file {image_path}: {e}")
-                             continue
-                
-                 if img:
-                     try:
-                         img = img.convert("RGBA")
-                         # Resize if size provided
-                         w = layer.get("width")
-                         h = layer.get("height")
-                         if w and h:
-                             img = img.resize((int(w), int(h)))
-                         
-                         canvas.paste(img, (x, y), img)
-                     except Exception as e:
-                         _LOGGER.error(f"Failed to process image layer: {e}")
+                 try:
+                     w = layer.get("width")
+                     h = layer.get("height")
+                     # Resize if size provided
+                     size = (int(w), int(h)) if w and h else None
+                     img = await self._load_layer_image(image_path, size)
+                     if img:
+                         ops.append(("image", img, (x, y)))
+                 except Exception as e:
+                     _LOGGER.error(f"Failed to process image layer: {e}")
+
+        # Icons missing from the cache are fetched concurrently, the draw
+        # operations then only read the cache
+        await self._async_fetch_icons(icons)
+        for i, op in enumerate(ops):
+            if op[0] == "icon":
+                icon_img = self._icon_cache.get(op[1])
+                ops[i] = ("icon", icon_img if icon_img is not MISSING else None, *op[2:])
+
+        # Pixel work happens off the event loop
+        canvas, rasters = await self.hass.async_add_executor_job(
+            _rasterize_face, ops, screen_size
+        )
+        for key, raster in rasters.items():
+            self._layer_cache[key] = raster
+            self._layer_cache.move_to_end(key)
+        while len(self._layer_cache) > LAYER_CACHE_SIZE:
+            self._layer_cache.popitem(last=False)
 
         return canvas
 
+    async def _load_layer_image(
+        self, image_path: str, size: tuple[int, int] | None
+    ) -> Image.Image | None:
+        """Return the decoded RGBA image of an image layer, reusing the cached one.
+
+        Local files are decoded again only when their mtime changes. Media
+        sources are trusted for MEDIA_IMAGE_TTL seconds and then revalidated
+        with their ETag. The returned image is shared and must not be modified.
+        """
+        key = (image_path, size)
+        cached = self._image_cache.get(key)
+        if cached:
+            self._image_cache.move_to_end(key)
+
+        # Handle Media Source
+        if image_path.startswith("media-source://"):
+            if cached and cached[2] > time.monotonic():
+                self.image_cache_stats["hits"] += 1
+                return cached[0]
+            try:
+                from homeassistant.components import media_source
+                # Resolve media source URL, typically /media/..., and fetch it
+                # over loopback so every media source works the same way
+                resolved = await media_source.async_resolve_media(self.hass, image_path, None)
+                url = f"http://127.0.0.1:{self.hass.http.server_port}{resolved.url}"
+                headers = {"If-None-Match": cached[1]} if cached and cached[1] else None
+                session = async_get_clientsession(self.hass)
+                async with session.get(url, headers=headers) as resp:
+                    if resp.status == 304 and cached:
+                        data = None
+                    elif resp.status == 200:
+                        data = await resp.read()
+                        validator = resp.headers.get("ETag")
+                    else:
+                        _LOGGER.error(f"Failed to fetch media: {resp.status}")
+                        return None
+            except Exception as e:
+                _LOGGER.error(f"Error resolving media source {image_path}: {e}")
+                return None
+
+            if data is None:
+                # Not modified, trust it for another TTL
+                self.image_cache_stats["hits"] += 1
+                self._image_cache[key] = (cached[0], cached[1], time.monotonic() + MEDIA_IMAGE_TTL)
+                return cached[0]
+            source = io.BytesIO(data)
+        else:
+            # Legacy/Local path handling
+            found = await self.hass.async_add_executor_job(self._find_image_file, image_path)
+            if not found:
+                return None
+            if cached and cached[1] == found:
+                self.image_cache_stats["hits"] += 1
+                return cached[0]
+            source, validator = found[0], found
+
+        self.image_cache_stats["misses"] += 1
+        img = await self.hass.async_add_executor_job(self._decode_layer_image, source, size)
+        if img is None:
+            return None
+        self._image_cache[key] = (img, validator, time.monotonic() + MEDIA_IMAGE_TTL)
+        while len(self._image_cache) > IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+        return img
+
+    def _find_image_file(self, image_path: str) -> tuple[str, int] | None:
+        """Resolve a local image layer path and return it with its mtime (executor)."""
+        # Resolve path (Check 'www' or absolute)
+        if not os.path.isabs(image_path):
+            # Default to config/www/idotmatrix/
+            base_www = self.hass.config.path("www", "idotmatrix")
+            potential = os.path.join(base_www, image_path)
+            if os.path.exists(potential):
+                image_path = potential
+            else:
+                # Try locally in integration (bundled icons?)
+                local = os.path.join(os.path.dirname(__file__), "images", image_path)
+                if os.path.exists(local):
+                    image_path = local
+        try:
+            return image_path, os.stat(image_path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _decode_layer_image(source, size: tuple[int, int] | None) -> Image.Image | None:
+        """Decode an image file or buffer into RGBA at the layer size (executor)."""
+        try:
+            with Image.open(source) as img:
+                img = img.convert("RGBA")
+            if size:
+                img = img.resize(size)
+            return img
+        except Exception as e:
+            _LOGGER.error(f"Failed to load image {source if isinstance(source, str) else 'data'}: {e}")
+            return None
+
     async def _load_icon(self, icon_ref: str, size: int) -> Image.Image | None:
         """Fetch and rasterize an icon reference."""
         if not icon_ref:
@@ -414,8 +848,8 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             return None
 
         cache_key = (icon_ref, size)
-        if cache_key in self._icon_cache:
-            cached = self._icon_cache[cache_key]
+        cached = self._icon_cache.get(cache_key)
+        if cached is not MISSING:
             return cached.copy() if cached else None
 
         url = None
@@ -423,7 +857,7 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             icon_name = icon_ref.split(":", 1)[1]
             icon_img = await self._render_mdi_icon(icon_name, size)
             if icon_img:
-                self._icon_cache[cache_key] = icon_img
+                self._icon_cache.set(cache_key, icon_img)
                 return icon_img.copy()
 
         if ":" in icon_ref and not icon_ref.startswith(("http://", "https://")):
@@ -440,13 +874,23 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("Unsupported icon reference: %s", icon_ref)
             return None
 
+        # Remote icons are kept rasterized on disk, shared by all devices and
+        # across restarts
+        store_path = None
+        if not icon_ref.startswith("/"):
+            store_path = self._icon_store_path(icon_ref, size)
+            icon_img = await self.hass.async_add_executor_job(self._read_stored_icon, store_path)
+            if icon_img:
+                self._icon_cache.set(cache_key, icon_img)
+                return icon_img.copy()
+
         try:
             session = async_get_clientsession(self.hass)
             ssl = False if url.startswith("https://api.iconify.design/") else None
             async with session.get(url, ssl=ssl) as resp:
                 if resp.status != 200:
                     _LOGGER.warning("Failed to fetch icon %s (status %s)", icon_ref, resp.status)
-                    self._icon_cache[cache_key] = None
+                    self._icon_cache.set(cache_key, None)
                     return None
                 content_type = resp.headers.get("Content-Type", "")
                 data = await resp.read()
@@ -463,20 +907,117 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
                             "SVG icon rendering unavailable; install cairo to enable SVG icons."
                         )
                         self._svg_error_logged = True
-                    self._icon_cache[cache_key] = None
+                    self._icon_cache.set(cache_key, None)
                     return None
-                icon_img = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
-            else:
-                icon_img = Image.open(io.BytesIO(data)).convert("RGBA")
-                if icon_img.size != (size, size):
-                    icon_img = icon_img.resize((size, size))
-            self._icon_cache[cache_key] = icon_img
+                data = png_bytes
+            icon_img = await self.hass.async_add_executor_job(self._decode_icon, data, size)
+            self._icon_cache.set(cache_key, icon_img)
+            if store_path:
+                try:
+                    await self.hass.async_add_executor_job(
+                        self._write_stored_icon, store_path, icon_img.copy()
+                    )
+                except OSError as exc:
+                    _LOGGER.debug("Failed to store icon %s on disk: %s", icon_ref, exc)
             return icon_img.copy()
         except Exception as exc:
             _LOGGER.warning("Failed to render icon %s: %s", icon_ref, exc)
-            self._icon_cache[cache_key] = None
+            self._icon_cache.set(cache_key, None)
+            return None
+
+    def _icon_store_path(self, icon_ref: str, size: int) -> str:
+        """Return the on-disk location of a rasterized remote icon."""
+        digest = hashlib.sha1(f"{icon_ref}|{size}".encode()).hexdigest()
+        return self.hass.config.path(*ICON_STORE_DIR, f"{digest}.png")
+
+    @staticmethod
+    def _read_stored_icon(path: str) -> Image.Image | None:
+        """Load a rasterized icon from disk unless it is missing or stale (executor)."""
+        try:
+            if time.time() - os.path.getmtime(path) > ICON_STORE_MAX_AGE:
+                return None
+            with Image.open(path) as img:
+                return img.convert("RGBA")
+        except Exception:
             return None
 
+    @classmethod
+    def _write_stored_icon(cls, path: str, icon_img: Image.Image) -> None:
+        """Atomically write a rasterized icon to disk (executor)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        icon_img.save(tmp_path, format="PNG")
+        os.replace(tmp_path, path)
+        cls._prune_icon_store(os.path.dirname(path))
+
+    @staticmethod
+    def _prune_icon_store(directory: str) -> None:
+        """Delete stale icons and trim the store to its size limit (executor)."""
+        entries = []
+        total = 0
+        now = time.time()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".png"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        # Oldest first; icons still in use are rewritten when they go stale
+        entries.sort()
+        for mtime, size, path in entries:
+            if total <= ICON_STORE_MAX_BYTES and now - mtime <= ICON_STORE_MAX_AGE:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def _face_icon_refs(self, layers: list) -> set[tuple[str, int]]:
+        """Return the (icon ref, size) pairs a face currently shows."""
+        icons = set()
+        for layer in layers:
+            if layer.get("type", "text") != "text":
+                continue
+            icon_ref = layer.get("icon")
+            if not icon_ref and (icon_template := layer.get("icon_template")):
+                try:
+                    icon_ref = self._render_template(icon_template)
+                except Exception:
+                    continue
+            if icon_ref and icon_ref.strip():
+                icons.add((icon_ref.strip(), int(layer.get("icon_size", 16))))
+        return icons
+
+    async def async_prefetch_icons(self, layers: list) -> None:
+        """Fetch the icons of a design ahead of its first render."""
+        await self._async_fetch_icons(self._face_icon_refs(layers))
+
+    async def _async_fetch_icons(self, icons: set[tuple[str, int]]) -> None:
+        """Load icons that are not cached yet, ICON_FETCH_CONCURRENCY at a time."""
+        missing = [icon for icon in icons if icon not in self._icon_cache]
+        if not missing:
+            return
+        semaphore = asyncio.Semaphore(ICON_FETCH_CONCURRENCY)
+
+        async def _fetch(icon_ref: str, size: int) -> None:
+            async with semaphore:
+                await self._load_icon(icon_ref, size)
+
+        await asyncio.gather(*(_fetch(icon_ref, size) for icon_ref, size in missing))
+
+    @staticmethod
+    def _decode_icon(data: bytes, size: int) -> Image.Image:
+        """Decode a downloaded icon to RGBA at the requested size (executor)."""
+        icon_img = Image.open(io.BytesIO(data)).convert("RGBA")
+        if icon_img.size != (size, size):
+            icon_img = icon_img.resize((size, size))
+        return icon_img
+
     @staticmethod
     def _svg_to_png(svg_data: bytes, size: int) -> bytes | None:
         """Convert SVG bytes to PNG bytes."""
@@ -505,22 +1046,25 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             return None
 
         font = self._mdi_fonts.get(size)
-        if not font:
-            font = ImageFont.truetype(io.BytesIO(self._mdi_font_bytes), size)
-            self._mdi_fonts[size] = font
-
-        icon_img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(icon_img)
-        char = chr(int(codepoint, 16))
-
-        bbox = draw.textbbox((0, 0), char, font=font)
-        x = (size - (bbox[2] - bbox[0])) // 2 - bbox[0]
-        y = (size - (bbox[3] - bbox[1])) // 2 - bbox[1]
-        draw.text((x, y), char, font=font, fill=(255, 255, 255, 255))
+        icon_img, loaded_font = await self.hass.async_add_executor_job(
+            _rasterize_mdi_icon,
+            self._mdi_font_bytes,
+            None if font is MISSING else font,
+            chr(int(codepoint, 16)),
+            size,
+        )
+        if font is MISSING:
+            self._mdi_fonts.set(size, loaded_font)
         return icon_img
 
     async def _ensure_mdi_assets(self) -> None:
-        """Load MDI meta and font bytes."""
+        """Load MDI meta and font bytes.
+
+        The assets are read from the on-disk cache, or from the bundled copy,
+        so icons work right after startup and offline. They are downloaded
+        only if neither exists, and revalidated in the background once the
+        cached copy is older than MDI_REVALIDATE_INTERVAL.
+        """
         if self._mdi_meta and self._mdi_font_bytes:
             return
 
@@ -528,45 +1072,134 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             if self._mdi_meta and self._mdi_font_bytes:
                 return
 
-            session = async_get_clientsession(self.hass)
-            try:
-                async with session.get(MDI_META_URL, ssl=False) as resp:
-                    if resp.status != 200:
-                        if not self._mdi_error_logged:
-                            _LOGGER.warning("Failed to fetch MDI metadata (status %s)", resp.status)
-                            self._mdi_error_logged = True
-                        return
-                    meta_data = await resp.json(content_type=None)
+            cache_dir = self.hass.config.path(*MDI_CACHE_DIR)
+            cached = await self.hass.async_add_executor_job(self._read_mdi_assets, cache_dir)
+            if cached is None:
+                cached = await self.hass.async_add_executor_job(
+                    self._read_mdi_assets, MDI_BUNDLED_DIR
+                )
+            if cached is None:
+                await self._async_fetch_mdi_assets({})
+                return
+
+            self._mdi_meta, self._mdi_font_bytes, info = cached
+            if time.time() - info.get("checked", 0) > MDI_REVALIDATE_INTERVAL:
+                self.hass.async_create_task(self._async_fetch_mdi_assets(info))
 
-                async with session.get(MDI_FONT_URL, ssl=False) as resp:
-                    if resp.status != 200:
-                        if not self._mdi_error_logged:
-                            _LOGGER.warning("Failed to fetch MDI font (status %s)", resp.status)
-                            self._mdi_error_logged = True
-                        return
+    async def _async_fetch_mdi_assets(self, info: dict) -> None:
+        """Download the MDI assets, or revalidate the cached ones by ETag."""
+        session = async_get_clientsession(self.hass)
+        try:
+            headers = {"If-None-Match": info["meta_etag"]} if info.get("meta_etag") else None
+            async with session.get(MDI_META_URL, ssl=False, headers=headers) as resp:
+                if resp.status == 304:
+                    meta_data = None
+                elif resp.status != 200:
+                    if not self._mdi_error_logged:
+                        _LOGGER.warning("Failed to fetch MDI metadata (status %s)", resp.status)
+                        self._mdi_error_logged = True
+                    return
+                else:
+                    meta_data = await resp.json(content_type=None)
+                    info["meta_etag"] = resp.headers.get("ETag")
+
+            headers = {"If-None-Match": info["font_etag"]} if info.get("font_etag") else None
+            async with session.get(MDI_FONT_URL, ssl=False, headers=headers) as resp:
+                if resp.status == 304:
+                    font_bytes = None
+                elif resp.status != 200:
+                    if not self._mdi_error_logged:
+                        _LOGGER.warning("Failed to fetch MDI font (status %s)", resp.status)
+                        self._mdi_error_logged = True
+                    return
+                else:
                     font_bytes = await resp.read()
-            except Exception as exc:
-                if not self._mdi_error_logged:
-                    _LOGGER.warning("Failed to load MDI assets: %s", exc)
-                    self._mdi_error_logged = True
-                return
+                    info["font_etag"] = resp.headers.get("ETag")
+        except Exception as exc:
+            if not self._mdi_error_logged:
+                _LOGGER.warning("Failed to load MDI assets: %s", exc)
+                self._mdi_error_logged = True
+            return
 
-            if isinstance(meta_data, list):
-                self._mdi_meta = {
+        info["checked"] = time.time()
+        if meta_data is None and font_bytes is None:
+            # Both unchanged, only remember when we last checked
+            meta = font_bytes = None
+        else:
+            if meta_data is not None:
+                if not isinstance(meta_data, list):
+                    return
+                meta = {
                     item["name"]: item["codepoint"]
                     for item in meta_data
                     if isinstance(item, dict) and "name" in item and "codepoint" in item
                 }
             else:
-                self._mdi_meta = None
+                meta = self._mdi_meta
+            font_bytes = font_bytes if font_bytes is not None else self._mdi_font_bytes
+            if not meta or not font_bytes:
+                return
 
+            if self._mdi_font_bytes is not None and font_bytes != self._mdi_font_bytes:
+                # New font release, drop everything rendered with the old one
+                self._mdi_fonts.clear()
+                for key in self._icon_cache.keys():
+                    if key[0].startswith("mdi:"):
+                        self._icon_cache.pop(key)
+            self._mdi_meta = meta
             self._mdi_font_bytes = font_bytes
+            self._mdi_unknown_icons.clear()
+
+        try:
+            await self.hass.async_add_executor_job(
+                self._write_mdi_assets, self.hass.config.path(*MDI_CACHE_DIR), meta, font_bytes, info
+            )
+        except OSError as exc:
+            _LOGGER.warning("Failed to cache MDI assets on disk: %s", exc)
+
+    @staticmethod
+    def _read_mdi_assets(directory: str) -> tuple[dict[str, str], bytes, dict] | None:
+        """Read cached MDI assets from a directory (executor)."""
+        try:
+            with open(os.path.join(directory, MDI_META_FILE), encoding="utf-8") as file:
+                meta = json.load(file)
+            with open(os.path.join(directory, MDI_FONT_FILE), "rb") as file:
+                font_bytes = file.read()
+        except (OSError, ValueError):
+            return None
+        try:
+            with open(os.path.join(directory, MDI_INFO_FILE), encoding="utf-8") as file:
+                info = json.load(file)
+        except (OSError, ValueError):
+            info = {}
+        if not isinstance(meta, dict) or not meta or not font_bytes:
+            return None
+        return meta, font_bytes, info
+
+    @staticmethod
+    def _write_mdi_assets(
+        directory: str, meta: dict[str, str] | None, font_bytes: bytes | None, info: dict
+    ) -> None:
+        """Atomically write the MDI assets and their ETags to the cache (executor)."""
+        os.makedirs(directory, exist_ok=True)
+        files = [(MDI_INFO_FILE, json.dumps(info).encode())]
+        if meta is not None:
+            files.append((MDI_META_FILE, json.dumps(meta).encode()))
+        if font_bytes is not None:
+            files.append((MDI_FONT_FILE, font_bytes))
+        # Info last, so a failed write never pairs new ETags with old content
+        for name, data in reversed(files):
+            tmp_path = os.path.join(directory, f"{name}.tmp")
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, os.path.join(directory, name))
 
     async def async_load_settings(self) -> None:
         """Load settings from storage."""
         if (data := await self._store.async_load()):
             _LOGGER.debug(f"Loaded persist settings: {data}")
             self.text_settings.update(data)
+            self._compile_face_templates(self.text_settings.get("layers", []))
 
     async def async_save_settings(self) -> None:
         """Save settings to storage."""
@@ -574,30 +1207,39 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         """Fetch data from the device."""
-        return {"connected": True}
+        return {
+            "connected": True,
+            "send_queue": self.conn.get_stats(),
+            "refresh": dict(self.refresh_stats),
+            "layer_cache": {**self.layer_cache_stats, "size": len(self._layer_cache)},
+            "image_cache": {**self.image_cache_stats, "size": len(self._image_cache)},
+            "icon_cache": self._icon_cache.stats(),
+            "mdi_font_cache": self._mdi_fonts.stats(),
+            "templates": {
+                tpl_str: {
+                    **stats,
+                    "avg_ms": stats["total_ms"] / stats["renders"] if stats["renders"] else 0.0,
+                }
+                for tpl_str, stats in self.template_stats.items()
+            },
+        }
+
+    async def async_update_device(self, reuse_resolved: bool = False) -> None:
+        """Send current configuration to the device.
 
-    async def async_update_device(self) -> None:
-        """Send current configuration to the device."""
+        reuse_resolved is set for entity-triggered refreshes, which only need
+        to re-resolve the face layers that depend on the changed entities.
+        """
         text = self.text_settings.get("current_text", "")
         settings = self.text_settings
 
         if self.display_mode == DISPLAY_MODE_DESIGN and settings.get("mode") == "advanced":
              # Advanced Rendering
              screen_size = int(settings.get("screen_size", 32))
-             image = await self._render_face(settings.get("layers", []), screen_size)
-             
-             # Save image in executor to avoid blocking
-             with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                tmp_path = tmp.name
-             
-             await self.hass.async_add_executor_job(image.save, tmp_path)
-             
-             try:
-                await IDMImage().setMode(1)
-                await IDMImage().uploadProcessed(tmp_path, pixel_size=screen_size)
-             finally:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
+             image = await self._render_face(
+                 settings.get("layers", []), screen_size, reuse_resolved=reuse_resolved
+             )
+             await self._async_upload_frame(image, screen_size)
              
         elif text:
             # Render Text (Basic Mode)
@@ -605,7 +1247,8 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
                 await self._set_multiline_text(text, settings)
             else:
                 # Standard Scroller
-                await Text().setMode(
+                self.invalidate_frame_cache()
+                await Text(self.conn).setMode(
                     text=text,
                     font_size=int(settings.get("font_size", 10)), 
                     font_path=settings.get("font"),
@@ -627,9 +1270,9 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             
             style = settings.get("clock_style", 0)
             show_date = settings.get("clock_date", True)
-            
-                
-            await Clock().setMode(
+
+            self.invalidate_frame_cache()
+            await Clock(self.conn).setMode(
                 style=style,
                 visibleDate=show_date,
                 hour24=h24,
@@ -647,26 +1290,21 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
     async def _set_multiline_text(self, text: str, settings: dict) -> None:
         """Generate an image from text and upload it."""
         screen_size = int(settings.get("screen_size", 32))
+        final_image = await self.hass.async_add_executor_job(
+            self._render_multiline_text, text, dict(settings)
+        )
+        await self._async_upload_frame(final_image, screen_size)
+
+    @staticmethod
+    def _render_multiline_text(text: str, settings: dict) -> Image.Image:
+        """Lay out and draw wrapped text (executor)."""
+        screen_size = int(settings.get("screen_size", 32))
         font_name = settings.get("font")
         color = tuple(settings.get("color", (255, 0, 0)))
         spacing = int(settings.get("spacing", 1))
         spacing_y = int(settings.get("spacing_y", 1))
         blur = int(settings.get("blur", 5))
         
-        # Resolve font path
-        # Note: __file__ here is coordinator.py, so we need to adjust path logic
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        fonts_dir = os.path.join(base_path, "fonts")
-        font_path = os.path.join(fonts_dir, "Rain-DRM3.otf")
-        
-        if font_name:
-            if not os.path.isabs(font_name):
-                 potential = os.path.join(fonts_dir, font_name)
-                 if os.path.exists(potential):
-                     font_path = potential
-            elif os.path.exists(font_name):
-                font_path = font_name
-                
         # Determine font size and max scanning range if autosize is on
         initial_font_size = int(settings.get("font_size", 10))
         target_font_size = initial_font_size
@@ -683,20 +1321,12 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             start_size = initial_font_size
             end_size = initial_font_size
 
-        font_path_to_use = font_path
-
         # Iterative resizing loop
         for s in range(start_size, end_size - 1, -1):
             target_font_size = s
-            try:
-                if font_path_to_use.lower().endswith(".bdf"):
-                     font = ImageFont.load(font_path_to_use)
-                     # BDF fonts are fixed size, autosize won't work well unless we pick different files.
-                     # For now, skip autosize on BDF or just use it as is.
-                else:
-                     font = ImageFont.truetype(font_path_to_use, s)
-            except:
-                font = ImageFont.load_default()
+            # BDF fonts only load at their native size, other sizes fall back
+            # to the default font.
+            font = FontCache.getFont(font_name, s)
 
             # Pixel-based Word Wrapping (Simulated for check)
             words = text.split(' ')
@@ -706,16 +1336,13 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             def get_word_width(word):
                 if not word: return 0
                 w = 0
-                for i, char in enumerate(word):
-                    bbox = font.getbbox(char)
-                    char_w = (bbox[2] - bbox[0]) if bbox else font.getlength(char)
-                    w += char_w + spacing
+                for char in word:
+                    w += FontCache.getGlyph(font, char).width + spacing
                 return w - spacing
             
             # Recalculate space width for this font size
             try:
-                space_bbox = font.getbbox(" ")
-                space_w = (space_bbox[2] - space_bbox[0]) if space_bbox else font.getlength(" ")
+                space_w = FontCache.getGlyph(font, " ").width
             except:
                 space_w = 4
             space_width = space_w + spacing
@@ -753,8 +1380,7 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
                  break
         
         # Draw lines using chosen target_font_size
-        text_layer = Image.new("RGBA", (screen_size, screen_size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(text_layer)
+        text_mask = Image.new("L", (screen_size, screen_size), 0)
         
         y = (screen_size - total_height) // 2 if settings.get("autosize", False) else 0 # Center vertically if autosizing
         if y < 0: y = 0
@@ -775,38 +1401,19 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             for i, word in enumerate(line_words):
                 for char in word:
                     if x >= screen_size: break
-                    draw.text((x, y), char, font=font, fill=(255, 255, 255, 255))
-                    bbox = font.getbbox(char)
-                    char_w = (bbox[2] - bbox[0]) if bbox else font.getlength(char)
-                    x += char_w + spacing
+                    glyph = FontCache.getGlyph(font, char)
+                    FontCache.drawGlyph(text_mask, (x, y), glyph)
+                    x += glyph.width + spacing
                 if i < len(line_words) - 1:
                      x += space_width
             y += line_height
             
-        if blur < 5:
-             r, g, b, a = text_layer.split()
-             gain = 1.0 + ((5 - blur) * 2.0) 
-             def apply_contrast(p):
-                 v = (p - 128) * gain + 128
-                 return max(0, min(255, int(v)))
-             a = a.point(apply_contrast)
-             text_layer.putalpha(a)
+        text_mask = _apply_text_blur(text_mask, blur)
              
         final_image = Image.new("RGB", (screen_size, screen_size), (0, 0, 0))
-        r, g, b, a = text_layer.split()
         colored_text = Image.new("RGB", (screen_size, screen_size), color)
-        final_image.paste(colored_text, mask=a)
-        
-        image = final_image
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            image.save(tmp.name)
-            tmp_path = tmp.name
-        try:
-            await IDMImage().setMode(1)
-            await IDMImage().uploadProcessed(tmp_path, pixel_size=screen_size)
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        final_image.paste(colored_text, mask=text_mask)
+        return final_image
 
     async def async_display_gif(
         self,
@@ -823,6 +1430,7 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         """
         # Stop any existing rotation
         await self.async_stop_gif_rotation()
+        self.invalidate_frame_cache()
 
         screen_size = int(self.text_settings.get("screen_size", 32))
         # Clamp interval to uint8 range
@@ -838,7 +1446,7 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
             # commands).  This gives the device its full GIF buffer instead of
             # the smaller per-slot batch buffer (~7 KB).
             _LOGGER.debug(f"Uploading single GIF (single protocol): {path}")
-            success = await IDMGif().uploadSingleRaw(path)
+            success = await IDMGif(self.conn, delta=self.gif_delta).uploadSingleRaw(path, pixel_size=screen_size)
             if not success:
                 _LOGGER.error(f"Single GIF upload failed: {path}")
         elif is_dir:
@@ -864,7 +1472,7 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
                 f"Batch uploading {len(batch)} GIFs from "
                 f"{len(gif_files)} available, interval={interval}s"
             )
-            success = await IDMGif().uploadBatch(
+            success = await IDMGif(self.conn, delta=self.gif_delta).uploadBatch(
                 batch, pixel_size=screen_size, interval=interval, raw=True
             )
             if not success:
@@ -879,11 +1487,11 @@ class IDotMatrixCoordinator(DataUpdateCoordinator):
         for attempt in range(max_retries):
             try:
                 # Check if connection manager has a connected client
-                conn = ConnectionManager()
+                conn = self.conn
                 if conn.client and not conn.client.is_connected:
                     _LOGGER.warning("Device disconnected, attempting reconnect...")
 
-                gif_instance = IDMGif()
+                gif_instance = IDMGif(self.conn, delta=self.gif_delta)
                 result = await gif_instance.uploadProcessed(file_path, pixel_size=pixel_size)
                 if result:
                     _LOGGER.debug(f"Successfully uploaded GIF: {file_path}")
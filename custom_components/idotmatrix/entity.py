@@ -5,7 +5,6 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, CONF_MAC, CONF_NAME
-from .client.connectionManager import ConnectionManager
 
 class IDotMatrixEntity(CoordinatorEntity):
     """Base class for iDotMatrix entities."""
@@ -17,8 +16,6 @@ class IDotMatrixEntity(CoordinatorEntity):
         self._attr_has_entity_name = True
         self._mac = entry.data[CONF_MAC]
         self._device_name = entry.data.get(CONF_NAME, "iDotMatrix")
-        # Ensure connection manager has the address (redundant but safe)
-        ConnectionManager().address = self._mac
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -62,7 +62,7 @@ class IDotMatrixLight(IDotMatrixEntity, LightEntity):
         
         # 1. On
         if not self.is_on:
-             await Common().screenOn()
+             await Common(self.coordinator.conn).screenOn()
              self.coordinator.text_settings["is_on"] = True
         
         # 2. Brightness
@@ -71,7 +71,7 @@ class IDotMatrixLight(IDotMatrixEntity, LightEntity):
             self.coordinator.text_settings["brightness"] = bright
             # Map 0-255 to 5-100
             val = max(5, int((bright / 255) * 100))
-            await Common().setBrightness(val)
+            await Common(self.coordinator.conn).setBrightness(val)
             
         # 3. Color
         if ATTR_RGB_COLOR in kwargs:
@@ -85,6 +85,6 @@ class IDotMatrixLight(IDotMatrixEntity, LightEntity):
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the light off."""
-        await Common().screenOff()
+        await Common(self.coordinator.conn).screenOff()
         self.coordinator.text_settings["is_on"] = False
         self.async_write_ha_state()
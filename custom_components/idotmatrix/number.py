@@ -24,8 +24,58 @@ async def async_setup_entry(
         IDotMatrixTextBlur(coordinator, entry),
         IDotMatrixTextFontSize(coordinator, entry),
         IDotMatrixFunTextDelay(coordinator, entry),
+        IDotMatrixRefreshCoalesce(coordinator, entry),
+        IDotMatrixRefreshMinInterval(coordinator, entry),
     ])
 
+class IDotMatrixRefreshCoalesce(IDotMatrixEntity, NumberEntity):
+    """Window for collapsing entity changes into a single design refresh."""
+
+    _attr_icon = "mdi:timer-cog-outline"
+    _attr_name = "Design Refresh Coalesce (sec)"
+    _attr_native_min_value = 0.0
+    _attr_native_max_value = 10.0
+    _attr_native_step = 0.1
+    _attr_entity_category = EntityCategory.CONFIG
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_refresh_coalesce"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("refresh_coalesce", 0.5)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["refresh_coalesce"] = float(value)
+        await self.coordinator.async_save_settings()
+        self.async_write_ha_state()
+
+class IDotMatrixRefreshMinInterval(IDotMatrixEntity, NumberEntity):
+    """Minimum time between entity-triggered design refreshes (max refresh rate)."""
+
+    _attr_icon = "mdi:speedometer-slow"
+    _attr_name = "Design Min Refresh Interval (sec)"
+    _attr_native_min_value = 0.0
+    _attr_native_max_value = 60.0
+    _attr_native_step = 0.5
+    _attr_entity_category = EntityCategory.CONFIG
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._mac}_refresh_min_interval"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.coordinator.text_settings.get("refresh_min_interval", 1.0)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value."""
+        self.coordinator.text_settings["refresh_min_interval"] = float(value)
+        await self.coordinator.async_save_settings()
+        self.async_write_ha_state()
+
 class IDotMatrixFunTextDelay(IDotMatrixEntity, NumberEntity):
     """Representation of the Fun Text Delay control."""
 
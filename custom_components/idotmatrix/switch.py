@@ -83,7 +83,8 @@ class IDotMatrixClockDate(IDotMatrixEntity, SwitchEntity):
         h24 = s.get("clock_format", "24h") == "24h"
         
         from .client.modules.clock import Clock
-        await Clock().setMode(style, True, h24, color[0], color[1], color[2])
+        self.coordinator.invalidate_frame_cache()
+        await Clock(self.coordinator.conn).setMode(style, True, h24, color[0], color[1], color[2])
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs) -> None:
@@ -95,7 +96,8 @@ class IDotMatrixClockDate(IDotMatrixEntity, SwitchEntity):
         h24 = s.get("clock_format", "24h") == "24h"
         
         from .client.modules.clock import Clock
-        await Clock().setMode(style, False, h24, color[0], color[1], color[2])
+        self.coordinator.invalidate_frame_cache()
+        await Clock(self.coordinator.conn).setMode(style, False, h24, color[0], color[1], color[2])
         self.async_write_ha_state()
 
 class IDotMatrixTextProportional(IDotMatrixEntity, SwitchEntity):
@@ -0,0 +1,32 @@
+#!/bin/bash
+# Download the Material Design Icons font and metadata into the integration's
+# bundled fallback folder, so mdi: icons render on the first start even when
+# Home Assistant has no internet access. Run it again after updating the
+# integration, as updates replace the folder.
+# Requires: curl and python3
+
+set -e
+
+DEST_DIR="${1:-$(dirname "$0")/custom_components/idotmatrix/mdi}"
+META_URL="https://raw.githubusercontent.com/Templarian/MaterialDesign/master/meta.json"
+FONT_URL="https://raw.githubusercontent.com/Templarian/MaterialDesign-Webfont/master/fonts/materialdesignicons-webfont.ttf"
+
+mkdir -p "$DEST_DIR"
+
+echo "Downloading font..."
+curl -fsSL "$FONT_URL" -o "$DEST_DIR/materialdesignicons-webfont.ttf"
+
+# The integration stores the metadata as an icon name -> codepoint map
+echo "Downloading metadata..."
+curl -fsSL "$META_URL" | python3 -c '
+import json, sys
+meta = {
+    item["name"]: item["codepoint"]
+    for item in json.load(sys.stdin)
+    if isinstance(item, dict) and "name" in item and "codepoint" in item
+}
+with open(sys.argv[1], "w", encoding="utf-8") as file:
+    json.dump(meta, file)
+' "$DEST_DIR/meta.json"
+
+echo "MDI assets written to $DEST_DIR"